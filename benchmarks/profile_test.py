@@ -11,15 +11,17 @@ from fastmssql import Connection, PoolConfig
 load_dotenv()
 
 
-def setup_uvloop():
-    """Setup uvloop as the event loop policy if available."""
+def uvloop_loop_factory():
+    """Return uvloop's event loop factory if uvloop is installed, else None.
+
+    Passed to ``asyncio.Runner`` instead of installing a global event loop
+    policy, which is deprecated as of Python 3.14.
+    """
     try:
         import uvloop
-
-        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-        return True
     except ImportError:
-        return False
+        return None
+    return uvloop.new_event_loop
 
 
 async def profile_queries():
@@ -50,14 +52,15 @@ if __name__ == "__main__":
     print("FastMSSQL Performance Profiling")
     print("=" * 60)
 
-    uvloop_available = setup_uvloop()
-    if uvloop_available:
+    loop_factory = uvloop_loop_factory()
+    if loop_factory is not None:
         print("🚀 Using uvloop for high-performance event loop")
 
     pr = cProfile.Profile()
     pr.enable()
 
-    asyncio.run(profile_queries())
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(profile_queries())
 
     pr.disable()
     s = StringIO()
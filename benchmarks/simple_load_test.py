@@ -1,6 +1,18 @@
 """
 Realistic SQL load test simulating normal database workloads.
 Tests mixed read/write operations with parameterized queries and transactions.
+
+The workers are asyncio-only: do not add asyncio.to_thread / run_in_executor
+calls to the worker path. Executor threads each get their own malloc arena and
+contend for the GIL, which skews both latency and memory numbers.
+
+Environment:
+    FASTMSSQL_TEST_CONNECTION_STRING  connection string to run against (required)
+    FASTMSSQL_BENCHMARK_CPUS          CPUs to pin the load generator to, e.g. "0-3"
+    FASTMSSQL_BENCHMARK_TARGET_RPS    combined requests/second to pace each
+                                      scenario at; unset runs unthrottled
+    FASTMSSQL_BENCHMARK_CONSUME_MODE  how SELECT results are consumed: "none"
+                                      (default), "count" or "materialize"
 """
 
 import asyncio
@@ -9,21 +21,124 @@ import random
 import statistics
 import string
 import time
-from collections import defaultdict
-from dataclasses import dataclass
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
 
 from fastmssql import Connection, PoolConfig
 
-
-def setup_uvloop():
-    """Setup uvloop as the event loop policy if available."""
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to a single sort
+    np = None
+
+NS_PER_SEC = 1_000_000_000
+
+# How SELECT results are consumed by the load test workers:
+#   "none"        - conn.execute(); rows are discarded inside the driver
+#   "count"       - conn.query() + len(); rows reach the QueryStream undecoded
+#   "materialize" - conn.query() + drain; every row is converted to Python
+CONSUME_MODES = ("none", "count", "materialize")
+
+# Workload statements are built once. Parameterized queries are sent through
+# sp_executesql, so byte-identical SQL text lets SQL Server reuse one cached
+# plan per statement instead of compiling again for each call site.
+SELECT_ORDERS_BY_USER_SQL = """SELECT COUNT(*) as order_count, SUM(amount) as total_amount
+    FROM load_test_orders WITH (NOLOCK)
+    WHERE user_id = @P1"""
+SELECT_RECENT_ORDERS_SQL = """SELECT TOP 50 u.username, o.order_id, o.amount, o.status
+    FROM load_test_users u WITH (NOLOCK)
+    LEFT JOIN load_test_orders o WITH (NOLOCK) ON u.user_id = o.user_id
+    WHERE u.is_active = 1
+    ORDER BY o.order_date DESC"""
+SELECT_ORDERS_BY_STATUS_SQL = """SELECT user_id, order_date, amount FROM load_test_orders WITH (NOLOCK)
+    WHERE status = @P1
+    ORDER BY order_date DESC"""
+INSERT_ORDER_SQL = """INSERT INTO load_test_orders (user_id, amount, description)
+    VALUES (@P1, @P2, @P3)"""
+UPDATE_ORDER_STATUS_SQL = """UPDATE load_test_orders
+    SET status = @P1, updated_at = GETDATE()
+    WHERE order_id = @P2"""
+DELETE_CANCELLED_ORDER_SQL = """DELETE FROM load_test_orders
+    WHERE order_id = @P1 AND status = 'cancelled'"""
+SELECT_STATUSES = ("pending", "completed", "cancelled")
+UPDATE_STATUSES = ("pending", "completed", "cancelled", "shipped")
+
+
+def uvloop_loop_factory():
+    """Return uvloop's event loop factory if uvloop is installed, else None.
+
+    Passed to ``asyncio.Runner`` instead of installing a global event loop
+    policy, which is deprecated as of Python 3.14.
+    """
     try:
         import uvloop
-
-        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-        return True
     except ImportError:
-        return False
+        return None
+    return uvloop.new_event_loop
+
+
+def pin_cpu_affinity(cpu_spec: str | None) -> set[int] | None:
+    """Pin the whole benchmark process (incl. driver threads) to ``cpu_spec``.
+
+    ``cpu_spec`` is a list like ``"0-3,8"``. Keeping the client on cores the
+    SQL Server does not use reduces scheduler jitter in tail latencies.
+    Returns the applied CPU set, or None when unset or unsupported.
+    """
+    if not cpu_spec:
+        return None
+    cpus = set()
+    for part in cpu_spec.split(","):
+        first, _, last = part.strip().partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+
+    if hasattr(os, "sched_setaffinity"):
+        # Linux affinity is per thread, and the driver's Tokio workers already
+        # exist once fastmssql is imported, so pin every thread of the process.
+        for tid in os.listdir("/proc/self/task"):
+            os.sched_setaffinity(int(tid), cpus)
+        return cpus
+    try:
+        import psutil
+
+        psutil.Process().cpu_affinity(sorted(cpus))
+        return cpus
+    except (ImportError, AttributeError):
+        return None
+
+
+def latency_summary(samples_ns: array) -> dict:
+    """Summarise nanosecond latencies as seconds (avg, median, p95, p99, min, max).
+
+    Percentiles use the nearest-rank method. With numpy available they are
+    selected with ``np.partition`` (O(N)); otherwise the samples are sorted once.
+    """
+    n = len(samples_ns)
+    if n == 0:
+        return dict.fromkeys(("avg", "median", "p95", "p99", "min", "max"), 0)
+
+    ranks = [max(0, min(n - 1, -(-n * q // 100) - 1)) for q in (50, 95, 99)]
+    if np is not None:
+        arr = np.frombuffer(samples_ns, dtype=np.int64)
+        avg = float(arr.mean())
+        low, high = int(arr.min()), int(arr.max())
+        picked = np.partition(arr, ranks)[ranks].tolist()
+    else:
+        ordered = sorted(samples_ns)
+        avg = sum(ordered) / n
+        low, high = ordered[0], ordered[-1]
+        picked = [ordered[r] for r in ranks]
+
+    median, p95, p99 = picked
+    return {
+        "avg": avg / NS_PER_SEC,
+        "median": median / NS_PER_SEC,
+        "p95": p95 / NS_PER_SEC if n >= 20 else 0,
+        "p99": p99 / NS_PER_SEC if n >= 100 else 0,
+        "min": low / NS_PER_SEC,
+        "max": high / NS_PER_SEC,
+    }
 
 
 @dataclass
@@ -38,6 +153,18 @@ class QueryMetrics:
     errors: int = 0
 
 
+@dataclass
+class WorkerStats:
+    """Per-worker results, returned from the worker and aggregated once."""
+
+    requests: int = 0
+    errors: int = 0
+    # SELECT rows seen via len(result); only counted in "count" consume mode
+    rows_counted: int = 0
+    response_times_ns: array = field(default_factory=lambda: array("q"))
+    metrics: QueryMetrics = field(default_factory=QueryMetrics)
+
+
 async def setup_test_data(connection_string: str):
     """Create test tables with realistic schema."""
     async with Connection(connection_string, PoolConfig.one()) as conn:
@@ -76,22 +203,16 @@ async def setup_test_data(connection_string: str):
             """)
             print("✓ Created load_test_orders table")
 
-            # Insert initial users (increased to 10,000 to reduce lock contention)
-            batch_size = 100
+            # Insert initial users (increased to 10,000 to reduce lock contention).
+            # bulk_insert packs rows into multi-row INSERTs up to SQL Server's
+            # parameter limit on one pooled connection, so seeding takes a
+            # handful of round trips instead of one per 100-row batch.
             total_users = 10000
-            for batch_start in range(0, total_users, batch_size):
-                values_clause = ", ".join(
-                    [
-                        f"(@P{i * 2 + 1}, @P{i * 2 + 2})"
-                        for i in range(min(batch_size, total_users - batch_start))
-                    ]
-                )
-                params = []
-                for i in range(batch_start, min(batch_start + batch_size, total_users)):
-                    params.extend([f"user_{i}", f"user_{i}@test.local"])
-
-                query = f"INSERT INTO load_test_users (username, email) VALUES {values_clause}"
-                await conn.execute(query, params)
+            await conn.bulk_insert(
+                "load_test_users",
+                ["username", "email"],
+                [[f"user_{i}", f"user_{i}@test.local"] for i in range(total_users)],
+            )
 
             print(f"✓ Inserted {total_users:,} test users")
 
@@ -117,133 +238,160 @@ async def setup_test_data(connection_string: str):
 
 
 async def realistic_load_test(
-    connection_string: str, workers: int = 10, duration: int = 15, warmup: int = 5
+    connection_string: str,
+    workers: int = 10,
+    duration: int = 15,
+    warmup: int = 5,
+    target_rps: float | None = None,
+    consume_mode: str = "none",
 ):
-    """Run a realistic load test with mixed SQL operations."""
+    """Run a realistic load test with mixed SQL operations.
+
+    Workers run unthrottled by default so the measured RPS reflects driver
+    throughput. Pass ``target_rps`` to pace the combined load instead.
+    ``consume_mode`` selects how SELECT results are consumed (see
+    ``CONSUME_MODES``), separating driver RPS from row-decode cost.
+    """
+    if consume_mode not in CONSUME_MODES:
+        raise ValueError(f"consume_mode must be one of {CONSUME_MODES}")
 
     print("\n🎯 Realistic SQL Load Test:")
     print(f"   Workers: {workers}")
     print(f"   Duration: {duration}s (+ {warmup}s warmup)")
+    if target_rps:
+        print(f"   Target RPS: {target_rps:,.0f}")
+    print(f"   SELECT consumption: {consume_mode}")
     print(
         "   Workload: Mixed SELECTs (60%), INSERTs (20%), UPDATEs (15%), DELETEs (5%)"
     )
     print("   Operations: Parameterized queries, transactions, realistic data")
 
-    # Thread-safe counters using locks
-    stats_lock = asyncio.Lock()
-    total_requests = 0
-    total_errors = 0
-    response_times = []
-    query_metrics = defaultdict(lambda: QueryMetrics())
-    worker_stats = defaultdict(lambda: {"requests": 0, "errors": 0})
+    # Preallocated per-worker latency buffer (nanoseconds), sized for a generous
+    # per-worker RPS. Raw int64s in an array avoid a Python list entry per request.
+    expected_rps_per_worker = 500
+    buffer_capacity = max(duration * expected_rps_per_worker, 1024)
+
+    # Optional pacing: each worker owns an equal share of the target rate.
+    pacing_interval_ns = int(workers * NS_PER_SEC / target_rps) if target_rps else 0
+
+    # Set by the last worker to finish warmup, so the pre-test pool snapshot is
+    # taken when warmup actually ends rather than after a guessed sleep
+    warmed_up_workers = 0
+    all_warmed_up = asyncio.Event()
 
     def generate_random_string(length: int = 20) -> str:
         """Generate random string for test data."""
         return "".join(random.choices(string.ascii_letters + string.digits, k=length))
 
-    async def worker(worker_id: int, conn: Connection):
+    async def worker(worker_id: int, conn: Connection) -> WorkerStats:
         """Worker that executes realistic SQL queries."""
-        nonlocal total_requests, total_errors
+        nonlocal warmed_up_workers
+        # Bind hot-loop callables once so each iteration uses fast local lookups
+        perf_counter_ns = time.perf_counter_ns
+        execute = conn.execute
+        randint = random.randint
+        choice = random.choice
+        uniform = random.uniform
+        # SELECTs are issued inline; the consume mode only decides the call
+        select = execute if consume_mode == "none" else conn.query
+        # Curry each statement's SQL text so the hot loop makes a single
+        # call with only the per-request parameters
+        count_users = partial(execute, "SELECT COUNT(*) FROM load_test_users")
+        select_orders_by_user = partial(select, SELECT_ORDERS_BY_USER_SQL)
+        select_recent_orders = partial(select, SELECT_RECENT_ORDERS_SQL)
+        select_orders_by_status = partial(select, SELECT_ORDERS_BY_STATUS_SQL)
+        insert_order = partial(execute, INSERT_ORDER_SQL)
+        update_order_status = partial(execute, UPDATE_ORDER_STATUS_SQL)
+        delete_cancelled_order = partial(execute, DELETE_CANCELLED_ORDER_SQL)
+        count_rows = consume_mode == "count"
+        materialize_rows = consume_mode == "materialize"
 
         # Warmup phase
-        warmup_end = time.time() + warmup
+        warmup_deadline_ns = perf_counter_ns() + warmup * NS_PER_SEC
         warmup_requests = 0
 
         print(f"Worker {worker_id}: Starting warmup...")
-        while time.time() < warmup_end:
+        while perf_counter_ns() < warmup_deadline_ns:
             try:
                 # Simple warmup query
-                await conn.execute("SELECT COUNT(*) FROM load_test_users")
+                await count_users()
                 warmup_requests += 1
             except Exception:
                 pass
 
         print(f"Worker {worker_id}: Warmup complete ({warmup_requests} requests)")
+        warmed_up_workers += 1
+        if warmed_up_workers == workers:
+            all_warmed_up.set()
 
         # Actual test phase with mixed workload
-        test_end = time.time() + duration
+        test_deadline_ns = perf_counter_ns() + duration * NS_PER_SEC
         local_requests = 0
         local_errors = 0
-        local_response_times = []
+        local_rows = 0
+        response_buf = array("q", bytes(8 * buffer_capacity))
+        buf_idx = 0
         local_metrics = QueryMetrics()
-
-        while time.time() < test_end:
+        next_slot_ns = perf_counter_ns()
+
+        while perf_counter_ns() < test_deadline_ns:
+            if pacing_interval_ns:
+                next_slot_ns += pacing_interval_ns
+                delay_ns = next_slot_ns - perf_counter_ns()
+                if delay_ns > 0:
+                    await asyncio.sleep(delay_ns / NS_PER_SEC)
             try:
-                operation = random.randint(1, 100)
-                start_time = time.perf_counter()
+                operation = randint(1, 100)
+                start_ns = perf_counter_ns()
 
                 if (
                     operation <= 75
                 ):  # 75% SELECT queries (increased from 60% to reduce lock contention)
                     # Query with WHERE clause and JOIN (use NOLOCK for reads to avoid locks)
-                    query_type = random.randint(1, 3)
+                    query_type = randint(1, 3)
                     if query_type == 1:
                         # Count orders by user (now with 10,000 users)
-                        user_id = random.randint(1, 10000)
-                        await conn.execute(
-                            """SELECT COUNT(*) as order_count, SUM(amount) as total_amount 
-                               FROM load_test_orders WITH (NOLOCK)
-                               WHERE user_id = @P1""",
-                            [user_id],
-                        )
+                        user_id = randint(1, 10000)
+                        result = await select_orders_by_user([user_id])
                     elif query_type == 2:
                         # Join users with their orders (use NOLOCK for reads)
-                        await conn.execute(
-                            """SELECT TOP 50 u.username, o.order_id, o.amount, o.status
-                               FROM load_test_users u WITH (NOLOCK)
-                               LEFT JOIN load_test_orders o WITH (NOLOCK) ON u.user_id = o.user_id
-                               WHERE u.is_active = 1
-                               ORDER BY o.order_date DESC"""
-                        )
+                        result = await select_recent_orders()
                     else:
                         # Search by status (use NOLOCK for reads)
-                        status = random.choice(["pending", "completed", "cancelled"])
-                        await conn.execute(
-                            """SELECT user_id, order_date, amount FROM load_test_orders WITH (NOLOCK)
-                               WHERE status = @P1 
-                               ORDER BY order_date DESC""",
-                            [status],
-                        )
+                        status = choice(SELECT_STATUSES)
+                        result = await select_orders_by_status([status])
+                    if count_rows:
+                        local_rows += len(result)
+                    elif materialize_rows:
+                        # Decode every row without keeping a list of them alive
+                        deque(result, maxlen=0)
                     local_metrics.select_queries += 1
 
                 elif operation <= 88:  # 13% INSERT queries (reduced from 20%)
                     # Insert new order (spread across all 10,000 users to reduce contention)
-                    user_id = random.randint(1, 10000)
-                    amount = round(random.uniform(10, 1000), 2)
+                    user_id = randint(1, 10000)
+                    amount = round(uniform(10, 1000), 2)
                     description = generate_random_string(50)
-                    await conn.execute(
-                        """INSERT INTO load_test_orders (user_id, amount, description) 
-                           VALUES (@P1, @P2, @P3)""",
-                        [user_id, amount, description],
-                    )
+                    await insert_order([user_id, amount, description])
                     local_metrics.insert_queries += 1
 
                 elif operation <= 96:  # 8% UPDATE queries (reduced from 15%)
                     # Update order status (spread across wider ID range to reduce lock contention)
-                    order_id = random.randint(1, 100000)
-                    new_status = random.choice(
-                        ["pending", "completed", "cancelled", "shipped"]
-                    )
-                    await conn.execute(
-                        """UPDATE load_test_orders 
-                           SET status = @P1, updated_at = GETDATE() 
-                           WHERE order_id = @P2""",
-                        [new_status, order_id],
-                    )
+                    order_id = randint(1, 100000)
+                    new_status = choice(UPDATE_STATUSES)
+                    await update_order_status([new_status, order_id])
                     local_metrics.update_queries += 1
 
                 else:  # 5% DELETE queries
                     # Delete old cancelled orders
-                    order_id = random.randint(1, 5000)
-                    await conn.execute(
-                        """DELETE FROM load_test_orders 
-                           WHERE order_id = @P1 AND status = 'cancelled'""",
-                        [order_id],
-                    )
+                    order_id = randint(1, 5000)
+                    await delete_cancelled_order([order_id])
                     local_metrics.delete_queries += 1
 
-                response_time = time.perf_counter() - start_time
-                local_response_times.append(response_time)
+                if buf_idx == len(response_buf):
+                    response_buf.frombytes(bytes(response_buf.itemsize * len(response_buf)))
+                response_buf[buf_idx] = perf_counter_ns() - start_ns
+                buf_idx += 1
                 local_requests += 1
 
             except Exception as e:
@@ -252,16 +400,13 @@ async def realistic_load_test(
                 if local_errors <= 3:
                     print(f"Worker {worker_id} error: {e}")
 
-        # Update global stats atomically
-        async with stats_lock:
-            total_requests += local_requests
-            total_errors += local_errors
-            response_times.extend(local_response_times)
-            worker_stats[worker_id]["requests"] = local_requests
-            worker_stats[worker_id]["errors"] = local_errors
-            query_metrics[worker_id] = local_metrics
-
-        print(f"Worker {worker_id}: {local_requests} requests, {local_errors} errors")
+        return WorkerStats(
+            requests=local_requests,
+            errors=local_errors,
+            rows_counted=local_rows,
+            response_times_ns=response_buf[:buf_idx],
+            metrics=local_metrics,
+        )
 
     print("Starting warmup phase...")
 
@@ -269,61 +414,79 @@ async def realistic_load_test(
     async with Connection(
         connection_string, PoolConfig.adaptive(workers)
     ) as shared_conn:
+        # Measure from worker start; the warmup window is subtracted afterwards
+        test_start = time.perf_counter()
+
         # Start all workers with the shared connection
         worker_tasks = [
             asyncio.create_task(worker(i, shared_conn)) for i in range(workers)
         ]
 
-        # Wait for warmup to complete
-        await asyncio.sleep(warmup + 1)
+        # Wait for warmup to complete; a worker that dies during warmup never
+        # reports in, so fall through and let the gather below surface it
+        try:
+            await asyncio.wait_for(all_warmed_up.wait(), timeout=warmup + 30)
+        except TimeoutError:
+            print("⚠️  Not every worker finished warmup")
         print("Test phase starting...")
 
         # Capture pool stats before test
         pool_stats_before = await shared_conn.pool_stats()
         print(f"   Pool Before: {pool_stats_before}")
 
-        # Measure actual test duration precisely
-        test_start = time.perf_counter()
-
-        # Wait for all workers to complete
-        await asyncio.gather(*worker_tasks)
+        # Wait for all workers to complete and aggregate their results once.
+        # Query errors are counted inside the workers; anything escaping a
+        # worker is a harness bug, so stop the run instead of hiding it.
+        try:
+            worker_stats = await asyncio.wait_for(
+                asyncio.gather(*worker_tasks), timeout=warmup + duration + 30
+            )
+        except BaseException as e:
+            print(f"❌ Load test aborted: {e!r}")
+            for task in worker_tasks:
+                task.cancel()
+            raise
         actual_duration = time.perf_counter() - test_start - warmup
 
+        # Per-worker summaries are printed once the clock has stopped, so
+        # console I/O from early finishers never overlaps the measured window
+        print("\n".join(
+            f"Worker {worker_id}: {ws.requests} requests, {ws.errors} errors"
+            for worker_id, ws in enumerate(worker_stats)
+        ))
+        total_requests = sum(ws.requests for ws in worker_stats)
+        total_errors = sum(ws.errors for ws in worker_stats)
+        response_times_ns = array("q")
+        for ws in worker_stats:
+            response_times_ns.extend(ws.response_times_ns)
+
         # Capture pool stats after test
         pool_stats_after = await shared_conn.pool_stats()
         print(f"   Pool After:  {pool_stats_after}")
 
         # Aggregate query type metrics
-        total_selects = sum(m.select_queries for m in query_metrics.values())
-        total_inserts = sum(m.insert_queries for m in query_metrics.values())
-        total_updates = sum(m.update_queries for m in query_metrics.values())
-        total_deletes = sum(m.delete_queries for m in query_metrics.values())
+        total_selects = sum(ws.metrics.select_queries for ws in worker_stats)
+        total_inserts = sum(ws.metrics.insert_queries for ws in worker_stats)
+        total_updates = sum(ws.metrics.update_queries for ws in worker_stats)
+        total_deletes = sum(ws.metrics.delete_queries for ws in worker_stats)
+        total_rows_counted = sum(ws.rows_counted for ws in worker_stats)
 
         # Calculate comprehensive results
         if total_requests > 0:
             rps = total_requests / actual_duration
             error_rate = (total_errors / (total_requests + total_errors)) * 100
 
-            # Response time statistics
-            avg_response_time = statistics.mean(response_times) if response_times else 0
-            median_response_time = (
-                statistics.median(response_times) if response_times else 0
-            )
-            p95_response_time = (
-                statistics.quantiles(response_times, n=20)[18]
-                if len(response_times) >= 20
-                else 0
-            )
-            p99_response_time = (
-                statistics.quantiles(response_times, n=100)[98]
-                if len(response_times) >= 100
-                else 0
-            )
-            min_response_time = min(response_times) if response_times else 0
-            max_response_time = max(response_times) if response_times else 0
+            # Response time statistics (computed in ns, reported in seconds)
+            latency = latency_summary(response_times_ns)
+            avg_response_time = latency["avg"]
+            median_response_time = latency["median"]
+            p95_response_time = latency["p95"]
+            p99_response_time = latency["p99"]
+            min_response_time = latency["min"]
+            max_response_time = latency["max"]
 
             # Worker distribution
-            requests_per_worker = [stats["requests"] for stats in worker_stats.values()]
+            requests_per_worker = [ws.requests for ws in worker_stats]
             worker_balance = (
                 (max(requests_per_worker) - min(requests_per_worker))
                 / max(requests_per_worker)
@@ -359,6 +522,8 @@ async def realistic_load_test(
         print(
             f"     DELETEs:  {total_deletes:,} ({total_deletes / total_requests * 100:.1f}%)"
         )
+        if consume_mode == "count":
+            print(f"     SELECT rows counted: {total_rows_counted:,}")
         print("\n   Response Times:")
         print(f"     Average: {avg_response_time * 1000:.2f}ms")
         print(f"     Median:  {median_response_time * 1000:.2f}ms")
@@ -383,6 +548,7 @@ async def realistic_load_test(
             "inserts": total_inserts,
             "updates": total_updates,
             "deletes": total_deletes,
+            "rows_counted": total_rows_counted,
         }
 
 
@@ -407,6 +573,16 @@ async def main():
         )
         return
 
+    pinned = pin_cpu_affinity(os.getenv("FASTMSSQL_BENCHMARK_CPUS"))
+    if pinned:
+        print(f"📌 Pinned benchmark to CPUs {sorted(pinned)}")
+
+    # Combined request rate to pace every scenario at, e.g. "2000"; unset (or 0)
+    # runs the workers unthrottled to measure peak driver throughput
+    target_rps = float(os.getenv("FASTMSSQL_BENCHMARK_TARGET_RPS") or 0) or None
+    # How workers consume SELECT results, one of CONSUME_MODES
+    consume_mode = os.getenv("FASTMSSQL_BENCHMARK_CONSUME_MODE") or "none"
+
     # Setup test data
     print("Setting up test database...")
     try:
@@ -444,6 +620,8 @@ async def main():
                 workers=workers,
                 duration=duration,
                 warmup=5,
+                target_rps=target_rps,
+                consume_mode=consume_mode,
             )
 
             iteration_results.append(result)
@@ -572,7 +750,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    uvloop_available = setup_uvloop()
-    if uvloop_available:
+    loop_factory = uvloop_loop_factory()
+    if loop_factory is not None:
         print("\n🚀 Using uvloop for high-performance event loop")
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
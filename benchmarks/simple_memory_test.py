@@ -1,6 +1,9 @@
 """
 Comprehensive memory usage test for fastmssql to understand its memory characteristics.
 Tests various scenarios including connection pooling, query execution, concurrency, and memory leaks.
+
+All workloads are asyncio-only. Avoid asyncio.to_thread / run_in_executor here:
+executor threads pin their own malloc arenas and would inflate the RSS figures.
 """
 
 import asyncio
@@ -17,15 +20,17 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-def setup_uvloop():
-    """Setup uvloop as the event loop policy if available."""
+def uvloop_loop_factory():
+    """Return uvloop's event loop factory if uvloop is installed, else None.
+
+    Passed to ``asyncio.Runner`` instead of installing a global event loop
+    policy, which is deprecated as of Python 3.14.
+    """
     try:
         import uvloop
-
-        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-        return True
     except ImportError:
-        return False
+        return None
+    return uvloop.new_event_loop
 
 
 @dataclass
@@ -50,6 +55,10 @@ class MemoryProfiler:
         self.snapshots: List[MemorySnapshot] = []
         self.verbose = verbose
         self.start_time = None
+        self.peak_rss_mb = 0.0
+        self.rss_sample_count = 0
+        self._sampler_stop: Optional[asyncio.Event] = None
+        self._sampler_task: Optional[asyncio.Task] = None
 
     def __enter__(self):
         gc.collect()  # Clean up before measurement
@@ -80,7 +89,7 @@ class MemoryProfiler:
                 f"  [END]   RSS: {self.end_memory:.2f} MB, VMS: {mem_info.vms / 1024 / 1024:.2f} MB"
             )
 
-        return {
+        result = {
             "memory_increase": self.memory_increase,
             "peak_memory": self.peak_memory,
             "start_memory": self.start_memory,
@@ -88,6 +97,45 @@ class MemoryProfiler:
             "elapsed_seconds": elapsed,
             "rss_vms_mb": mem_info.vms / 1024 / 1024,
         }
+        if self.rss_sample_count:
+            result["peak_rss_mb"] = max(self.peak_rss_mb, self.end_memory)
+            result["rss_samples"] = self.rss_sample_count
+        return result
+
+    async def _sample_rss(self, interval: float):
+        """Track peak RSS every ``interval`` seconds until the sampler is stopped.
+
+        The running peak lives in locals and is published once on exit, so a
+        long or high-frequency run neither grows a sample buffer nor writes
+        instance attributes per sample.
+        """
+        memory_info = self.process.memory_info
+        stop = self._sampler_stop
+        peak = 0
+        count = 0
+        while not stop.is_set():
+            rss = memory_info().rss
+            if rss > peak:
+                peak = rss
+            count += 1
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+        self.peak_rss_mb = peak / 1024 / 1024
+        self.rss_sample_count = count
+
+    def start_rss_sampler(self, interval: float = 0.25):
+        """Start a single background task that tracks peak RSS mid-run."""
+        self._sampler_stop = asyncio.Event()
+        self._sampler_task = asyncio.create_task(self._sample_rss(interval))
+
+    async def stop_rss_sampler(self):
+        """Stop the background RSS sampler and wait for it to finish."""
+        if self._sampler_task is not None:
+            self._sampler_stop.set()
+            await self._sampler_task
+            self._sampler_task = None
 
     def take_snapshot(self, label: str = ""):
         """Take a memory snapshot during execution"""
@@ -146,7 +194,7 @@ async def test_sequential_queries(query_count: int = 100):
         async with Connection(connection_string) as conn:
             for i in range(query_count):
                 result = await conn.query(
-                    "SELECT @i as iteration, @@VERSION as version, NEWID() as id", [i]
+                    "SELECT @P1 as iteration, @@VERSION as version, NEWID() as id", [i]
                 )
                 # Ensure results are materialized
                 rows = result.all()
@@ -181,11 +229,13 @@ async def test_large_result_sets(batch_size: int = 1000):
     with MemoryProfiler("Large Result Sets", verbose=True) as profiler:
         async with Connection(connection_string) as conn:
             # Test with multiple result sets of varying sizes
+            # One parameterized statement for every size, so the server compiles
+            # a single plan instead of one ad-hoc plan per TOP literal
             for size_mult in [1, 2, 4, 8]:
                 result = await conn.query(
-                    f"""
+                    """
                     WITH NumberSeries AS (
-                        SELECT TOP {batch_size * size_mult}
+                        SELECT TOP (@P1)
                             ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) as num,
                             NEWID() as guid,
                             CONVERT(VARCHAR(100), GETDATE()) as date_str,
@@ -194,7 +244,8 @@ async def test_large_result_sets(batch_size: int = 1000):
                         CROSS JOIN sys.objects b
                     )
                     SELECT * FROM NumberSeries
-                    """
+                    """,
+                    [batch_size * size_mult],
                 )
                 rows = result.all()
                 print(f"    Fetched {len(rows)} rows ({size_mult}x batch size)")
@@ -229,15 +280,18 @@ async def test_concurrent_operations(
                 results = []
                 for i in range(queries_per_worker):
                     result = await conn.query(
-                        "SELECT @worker_id as worker, @i as iteration, @@VERSION as version",
+                        "SELECT @P1 as worker, @P2 as iteration, @@VERSION as version",
                         [worker_id, i],
                     )
                     results.extend(result.all())
                 return results
 
-            # Run concurrent workers
-            tasks = [worker(i) for i in range(worker_count)]
-            all_results = await asyncio.gather(*tasks)
+            # Run concurrent workers while sampling RSS in the background
+            profiler.start_rss_sampler()
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(worker(i)) for i in range(worker_count)]
+            all_results = [task.result() for task in tasks]
+            await profiler.stop_rss_sampler()
 
             total_rows = sum(len(result) for result in all_results)
             total_operations = worker_count * queries_per_worker
@@ -253,6 +307,10 @@ async def test_concurrent_operations(
     result = profiler.__exit__(None, None, None)
     print(f"  Total memory overhead: {result['memory_increase']:.2f} MB")
     print(f"  Peak traced memory: {result['peak_memory']:.2f} MB")
+    if "peak_rss_mb" in result:
+        print(
+            f"  Peak RSS: {result['peak_rss_mb']:.2f} MB ({result['rss_samples']} samples)"
+        )
     print(
         f"  Per operation: {result['memory_increase'] / (worker_count * queries_per_worker) * 1024:.3f} KB"
     )
@@ -286,8 +344,8 @@ async def test_memory_leak_detection(batch_count: int = 10, ops_per_batch: int =
                     result = await conn.query(
                         """
                         SELECT 
-                            @batch as batch_num,
-                            @op as operation_num,
+                            @P1 as batch_num,
+                            @P2 as operation_num,
                             NEWID() as test_guid,
                             REPLICATE('x', 1000) as padding_data
                         """,
@@ -360,7 +418,7 @@ async def test_batch_operations(batch_size: int = 50):
                 # Execute batch of parameterized queries
                 for params in batch_data:
                     result = await conn.query(
-                        "SELECT @batch as batch, @item as item_num, @label as label",
+                        "SELECT @P1 as batch, @P2 as item_num, @P3 as label",
                         params,
                     )
                     _ = result.all()
@@ -487,7 +545,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    uvloop_available = setup_uvloop()
-    if uvloop_available:
+    loop_factory = uvloop_loop_factory()
+    if loop_factory is not None:
         print("\n🚀 Using uvloop for high-performance event loop")
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -4,26 +4,80 @@ import asyncio
 import os
 import fastmssql
 
-async def test_service_principal_auth():
-    """Test Service Principal authentication."""
-    print("Testing Service Principal authentication...")
-    
-    # These would typically come from environment variables or secure configuration
-    azure_cred = fastmssql.AzureCredential.service_principal(
-        client_id=os.getenv("AZURE_CLIENT_ID", "your-client-id"),
-        client_secret=os.getenv("AZURE_CLIENT_SECRET", "your-client-secret"),
-        tenant_id=os.getenv("AZURE_TENANT_ID", "your-tenant-id")
+REQUIRED_ENV_VARS = (
+    'AZURE_CLIENT_ID',
+    'AZURE_CLIENT_SECRET',
+    'AZURE_TENANT_ID',
+    'AZURE_SQL_SERVER',
+    'AZURE_SQL_DATABASE',
+)
+SECRET_ENV_VARS = frozenset({'AZURE_CLIENT_SECRET'})
+
+# Every authentication test runs the same probe. Keeping the text in one place
+# keeps it byte-identical, so the server can reuse the cached plan.
+PROBE_SQL = "SELECT GETDATE() as current_dt, USER_NAME() as user_name"
+
+# Azure SQL drops connections that sit idle for ~30 minutes. Recycling sockets
+# after 25 minutes keeps the min_idle connections from going stale, and reaping
+# burst connections after 15 idle minutes stays well inside the cutoff.
+AZURE_POOL_CONFIG = fastmssql.PoolConfig(
+    max_size=4,
+    min_idle=2,
+    max_lifetime_secs=25 * 60,
+    idle_timeout_secs=15 * 60,
+)
+
+def uvloop_loop_factory():
+    """Return uvloop's event loop factory if uvloop is installed, else None.
+
+    Passed to ``asyncio.Runner`` instead of installing a global event loop
+    policy, which is deprecated as of Python 3.14.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+def azure_connection(azure_cred):
+    """Build a Connection to the configured Azure SQL database.
+
+    The pool is created lazily on the first query, so the Connection can be
+    shared by several coroutines without entering it first.
+    """
+    return fastmssql.Connection(
+        server=os.getenv("AZURE_SQL_SERVER", "yourserver.database.windows.net"),
+        database=os.getenv("AZURE_SQL_DATABASE", "yourdatabase"),
+        azure_credential=azure_cred,
+        pool_config=AZURE_POOL_CONFIG
     )
 
+async def probe_server(server, port=1433, timeout=2.0):
+    """Fail fast when the server's TDS port cannot be reached."""
+    _, writer = await asyncio.wait_for(asyncio.open_connection(server, port), timeout)
+    writer.close()
+    await writer.wait_closed()
+
+async def warm_pool(conn):
+    """Open min_idle connections in parallel up front.
+
+    The token fetch and TLS handshakes are paid here rather than by the first
+    query of each test.
+    """
     try:
-        async with fastmssql.Connection(
-            server=os.getenv("AZURE_SQL_SERVER", "yourserver.database.windows.net"),
-            database=os.getenv("AZURE_SQL_DATABASE", "yourdatabase"),
-            azure_credential=azure_cred
-        ) as conn:
-            result = await conn.query("SELECT GETDATE() as current_dt, USER_NAME() as user_name")
-            for row in result.rows():
-                print(f"Connected successfully! Current time: {row['current_dt']}, User: {row['user_name']}")
+        warmed = await conn.warm(AZURE_POOL_CONFIG.min_idle)
+        print(f"Warmed service principal pool: {warmed} connections")
+    except Exception as e:
+        print(f"Pool warm-up failed: {e}")
+
+async def test_service_principal_auth(conn):
+    """Test Service Principal authentication on the shared connection."""
+    print("Testing Service Principal authentication...")
+
+    try:
+        result = await conn.query(PROBE_SQL)
+        for row in result.rows():
+            print(f"Connected successfully! Current time: {row['current_dt']}, User: {row['user_name']}")
     except Exception as e:
         print(f"Service Principal authentication failed: {e}")
 
@@ -34,12 +88,8 @@ async def test_managed_identity_auth():
     azure_cred = fastmssql.AzureCredential.managed_identity(client_id=None)
 
     try:
-        async with fastmssql.Connection(
-            server=os.getenv("AZURE_SQL_SERVER", "yourserver.database.windows.net"),
-            database=os.getenv("AZURE_SQL_DATABASE", "yourdatabase"),
-            azure_credential=azure_cred
-        ) as conn:
-            result = await conn.query("SELECT GETDATE() as current_dt, USER_NAME() as user_name")
+        async with azure_connection(azure_cred) as conn:
+            result = await conn.query(PROBE_SQL)
             for row in result.rows():
                 print(f"Managed Identity connected! Current time: {row['current_dt']}, User: {row['user_name']}")
     except Exception as e:
@@ -54,12 +104,8 @@ async def test_user_assigned_managed_identity():
     )
 
     try:
-        async with fastmssql.Connection(
-            server=os.getenv("AZURE_SQL_SERVER", "yourserver.database.windows.net"),
-            database=os.getenv("AZURE_SQL_DATABASE", "yourdatabase"),
-            azure_credential=azure_cred
-        ) as conn:
-            result = await conn.query("SELECT GETDATE() as current_dt, USER_NAME() as user_name")
+        async with azure_connection(azure_cred) as conn:
+            result = await conn.query(PROBE_SQL)
             for row in result.rows():
                 print(f"User-Assigned MI connected! Current time: {row['current_dt']}, User: {row['user_name']}")
     except Exception as e:
@@ -78,12 +124,8 @@ async def test_access_token_auth():
     azure_cred = fastmssql.AzureCredential.access_token(access_token)
 
     try:
-        async with fastmssql.Connection(
-            server=os.getenv("AZURE_SQL_SERVER", "yourserver.database.windows.net"),
-            database=os.getenv("AZURE_SQL_DATABASE", "yourdatabase"),
-            azure_credential=azure_cred
-        ) as conn:
-            result = await conn.query("SELECT GETDATE() as current_dt, USER_NAME() as user_name")
+        async with azure_connection(azure_cred) as conn:
+            result = await conn.query(PROBE_SQL)
             for row in result.rows():
                 print(f"Access Token connected! Current time: {row['current_dt']}, User: {row['user_name']}")
     except Exception as e:
@@ -96,46 +138,33 @@ async def test_default_azure_auth():
     azure_cred = fastmssql.AzureCredential.default()
 
     try:
-        async with fastmssql.Connection(
-            server=os.getenv("AZURE_SQL_SERVER", "yourserver.database.windows.net"),
-            database=os.getenv("AZURE_SQL_DATABASE", "yourdatabase"),
-            azure_credential=azure_cred
-        ) as conn:
-            result = await conn.query("SELECT GETDATE() as current_dt, USER_NAME() as user_name")
+        async with azure_connection(azure_cred) as conn:
+            result = await conn.query(PROBE_SQL)
             for row in result.rows():
                 print(f"Default credential connected! Current time: {row['current_dt']}, User: {row['user_name']}")
     except Exception as e:
         print(f"Default Azure credential authentication failed: {e}")
 
-async def test_database_operations():
-    """Test various database operations with Azure authentication."""
+async def test_database_operations(conn):
+    """Test various database operations on the shared connection."""
     print("\nTesting database operations with Azure authentication...")
-    
-    azure_cred = fastmssql.AzureCredential.service_principal(
-        client_id=os.getenv("AZURE_CLIENT_ID", "your-client-id"),
-        client_secret=os.getenv("AZURE_CLIENT_SECRET", "your-client-secret"),
-        tenant_id=os.getenv("AZURE_TENANT_ID", "your-tenant-id")
-    )
 
     try:
-        async with fastmssql.Connection(
-            server=os.getenv("AZURE_SQL_SERVER", "yourserver.database.windows.net"),
-            database=os.getenv("AZURE_SQL_DATABASE", "yourdatabase"),
-            azure_credential=azure_cred
-        ) as conn:
-            # Test SELECT query
-            result = await conn.query(
-                "SELECT name, database_id FROM sys.databases WHERE database_id <= @P1", 
-                [5]
-            )
-            print("Available databases:")
-            for row in result.rows():
-                print(f"  - {row['name']} (ID: {row['database_id']})")
-            
-            # Test connection pool statistics
-            stats = await conn.pool_stats()
-            print(f"\nConnection Pool Stats: {stats}")
-            
+        # Test SELECT query, streamed: query_iter yields each row as it arrives
+        # instead of buffering the whole result first
+        rows = conn.query_iter(
+            "SELECT name, database_id FROM sys.databases WHERE database_id <= @P1",
+            [5]
+        )
+        print("Available databases:")
+        print("\n".join(
+            [f"  - {row['name']} (ID: {row['database_id']})" async for row in rows]
+        ))
+        
+        # Test connection pool statistics
+        stats = await conn.pool_stats()
+        print(f"\nConnection Pool Stats: {stats}")
+        
     except Exception as e:
         print(f"Database operations failed: {e}")
 
@@ -144,20 +173,15 @@ async def main():
     print("FastMSSSQL Azure Authentication Examples")
     print("=" * 50)
     
-    # Check for environment variables
-    required_vars = {
-        'AZURE_CLIENT_ID': os.getenv('AZURE_CLIENT_ID'),
-        'AZURE_CLIENT_SECRET': os.getenv('AZURE_CLIENT_SECRET'),
-        'AZURE_TENANT_ID': os.getenv('AZURE_TENANT_ID'),
-        'AZURE_SQL_SERVER': os.getenv('AZURE_SQL_SERVER'),
-        'AZURE_SQL_DATABASE': os.getenv('AZURE_SQL_DATABASE')
-    }
+    # Snapshot the environment once rather than calling os.getenv per variable
+    env = os.environ.copy()
     
     print("Environment Variables:")
     missing_vars = []
-    for var, value in required_vars.items():
+    for var in REQUIRED_ENV_VARS:
+        value = env.get(var)
         if value:
-            display_value = '***' if 'SECRET' in var else value
+            display_value = '***' if var in SECRET_ENV_VARS else value
             print(f"✅ {var}: {display_value}")
         else:
             print(f"❌ {var}: Not set")
@@ -173,15 +197,40 @@ async def main():
     
     print("=" * 50)
     
-    # Run tests
-    await test_service_principal_auth()
-    await test_managed_identity_auth()
-    await test_user_assigned_managed_identity()
-    await test_access_token_auth()
-    await test_default_azure_auth()
-    await test_database_operations()
-    
-    print("\nAzure authentication testing completed!")
+    # Both service principal tests use the same credential, so they share one
+    # connection (one token fetch, one pool). Each other test exercises a
+    # different credential and needs its own login, but none depends on another,
+    # so all of them run concurrently and their handshakes overlap.
+    azure_cred = fastmssql.AzureCredential.service_principal(
+        client_id=env["AZURE_CLIENT_ID"],
+        client_secret=env["AZURE_CLIENT_SECRET"],
+        tenant_id=env["AZURE_TENANT_ID"]
+    )
+    sp_conn = azure_connection(azure_cred)
+    try:
+        # Probe the server's TDS port alongside the pool warm-up. If the server
+        # is unreachable the probe fails within seconds and the TaskGroup cancels
+        # the warm-up, instead of every test waiting out its own connect timeout.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(probe_server(env["AZURE_SQL_SERVER"]))
+            tg.create_task(warm_pool(sp_conn))
+        
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(test_service_principal_auth(sp_conn))
+            tg.create_task(test_managed_identity_auth())
+            tg.create_task(test_user_assigned_managed_identity())
+            tg.create_task(test_access_token_auth())
+            tg.create_task(test_default_azure_auth())
+            tg.create_task(test_database_operations(sp_conn))
+    except* (OSError, TimeoutError) as eg:
+        print(f"❌ Cannot reach {env['AZURE_SQL_SERVER']}: {eg.exceptions[0]!r}")
+    else:
+        print("\nAzure authentication testing completed!")
+    finally:
+        await sp_conn.disconnect()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # The authentication tests run concurrently, on uvloop when it is available
+    loop_factory = uvloop_loop_factory()
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
\ No newline at end of file
@@ -2,7 +2,6 @@
 
 import asyncio
 import os
-import fastmssql
 
 async def main():
     """Simple Azure Service Principal authentication example."""
@@ -20,6 +19,10 @@ async def main():
         print("\n💡 To fix this, run: source setup_files/azure.env")
         return
     
+    # Import after the environment check so a misconfigured run exits without
+    # loading the native extension
+    import fastmssql
+    
     # Create Azure Service Principal credential
     azure_cred = fastmssql.AzureCredential.service_principal(
         client_id=os.getenv("AZURE_CLIENT_ID"),
@@ -33,14 +36,16 @@ async def main():
             database=os.getenv("AZURE_SQL_DATABASE"),
             azure_credential=azure_cred
         ) as conn:
-            # Test connection
-            result = await conn.query("SELECT GETDATE() as current_dt, USER_NAME() as user_name")
-            for row in result.rows():
+            # Test the connection and a parameterized query in one round trip:
+            # both statements go out as a single batch on one pooled connection
+            probe, message = await conn.query_results(
+                "SELECT GETDATE() as current_dt, USER_NAME() as user_name; "
+                "SELECT @P1 as message",
+                ["Hello from Azure!"]
+            )
+            for row in probe.rows():
                 print(f"✅ Connected! Time: {row['current_dt']}, User: {row['user_name']}")
-            
-            # Test parameterized query
-            result = await conn.query("SELECT @P1 as message", ["Hello from Azure!"])
-            for row in result.rows():
+            for row in message.rows():
                 print(f"📝 Message: {row['message']}")
             
             print("\n🎉 Azure authentication example completed successfully!")
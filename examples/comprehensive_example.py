@@ -10,6 +10,7 @@ Features demonstrated:
 - Data modification with execute() method
 - Parameterized queries for security and performance
 - Connection pooling configuration
+- Pool monitoring with native asyncio tasks
 - SSL/TLS configuration
 - Error handling patterns
 - Batch operations (query_batch, execute_batch)
@@ -19,56 +20,94 @@ Features demonstrated:
 """
 
 import asyncio
+import logging
+import random
+import time
+from collections import deque
 
-from fastmssql import Connection, EncryptionLevel, PoolConfig, SslConfig
+from fastmssql import Connection, EncryptionLevel, PoolConfig, SqlError, SslConfig
 
+logger = logging.getLogger(__name__)
 
-async def basic_usage_example():
+CONN_STR = "Server=localhost;Database=TestDB;User Id=testuser;Password=testpass;"
+
+# PoolConfig and SslConfig are validated when they are built; build them once
+# and share them rather than constructing (and re-validating) new ones for
+# every connection
+POOL_CONFIG = PoolConfig(
+    max_size=20,
+    min_idle=2,
+    connection_timeout_secs=30,
+    idle_timeout_secs=600,
+)
+
+SSL_CONFIG = SslConfig(
+    encryption_level=EncryptionLevel.Required,
+    trust_server_certificate=False,
+    # certificate_path="/path/to/cert.pem"  # Optional certificate path
+)
+
+
+def uvloop_loop_factory():
+    """Return uvloop's event loop factory if uvloop is installed, else None.
+
+    Passed to ``asyncio.Runner`` instead of installing a global event loop
+    policy, which is deprecated as of Python 3.14.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+async def basic_usage_example(conn):
     """
     Basic usage example showing the fundamental operations.
     """
     print("🔹 Basic Usage Example")
     print("-" * 40)
 
-    # Using async context manager - automatically handles connect/disconnect
-    async with Connection(
-        "Server=localhost;Database=TestDB;User Id=testuser;Password=testpass;"
-    ) as conn:
-        # === SELECT QUERIES - Use query() method ===
-        print("📖 SELECT Operations:")
+    # === SELECT QUERIES - Use query() method ===
+    print("📖 SELECT Operations:")
 
-        # Simple SELECT query
-        result = await conn.query("SELECT TOP 5 * FROM users")
-        rows = result.rows()
-        for row in rows:
-            print(f"  User: {row.get('name', 'N/A')}, Age: {row.get('age', 'N/A')}")
-
-        # Parameterized SELECT query
-        result = await conn.query(
+    # A simple and a parameterized SELECT. They are independent, so both are
+    # sent at once on two pooled connections instead of one after the other
+    result, filtered = await asyncio.gather(
+        conn.query("SELECT TOP 5 * FROM users"),
+        conn.query(
             "SELECT * FROM users WHERE age > @P1 AND city = @P2", [25, "New York"]
-        )
-        users = result.rows()
-        print(f"  Found {len(users)} users in New York over 25")
-
-        # === DATA MODIFICATION - Use execute() method ===
-        print("\n🔧 Data Modification Operations:")
-
-        # INSERT operation
-        affected = await conn.execute(
-            "INSERT INTO users (name, email, age, city) VALUES (@P1, @P2, @P3, @P4)",
-            ["John Doe", "john.doe@example.com", 30, "Chicago"],
-        )
-        print(f"  Inserted {affected} row(s)")
+        ),
+    )
+    print("\n".join(
+        f"  User: {row.name}, Age: {row.age}"
+        for row in result.rows()
+    ))
+
+    users = filtered.rows()
+    print(f"  Found {len(users)} users in New York over 25")
+
+    # === DATA MODIFICATION - Use execute() method ===
+    print("\n🔧 Data Modification Operations:")
+
+    # The writes below depend on each other (the UPDATE needs the INSERTed
+    # row), so they stay sequential
+    # INSERT operation
+    affected = await conn.execute(
+        "INSERT INTO users (name, email, age, city) VALUES (@P1, @P2, @P3, @P4)",
+        ["John Doe", "john.doe@example.com", 30, "Chicago"],
+    )
+    print(f"  Inserted {affected} row(s)")
 
-        # UPDATE operation
-        affected = await conn.execute(
-            "UPDATE users SET age = @P1 WHERE name = @P2", [31, "John Doe"]
-        )
-        print(f"  Updated {affected} row(s)")
+    # UPDATE operation
+    affected = await conn.execute(
+        "UPDATE users SET age = @P1 WHERE name = @P2", [31, "John Doe"]
+    )
+    print(f"  Updated {affected} row(s)")
 
-        # DELETE operation
-        affected = await conn.execute("DELETE FROM users WHERE age > @P1", [100])
-        print(f"  Deleted {affected} row(s)")
+    # DELETE operation
+    affected = await conn.execute("DELETE FROM users WHERE age > @P1", [100])
+    print(f"  Deleted {affected} row(s)")
 
 
 async def connection_configuration_example():
@@ -90,13 +129,15 @@ async def connection_configuration_example():
 
     # Method 2: Individual parameters
     print("\n📡 Method 2: Individual Parameters")
-    async with Connection(
+    conn = Connection(
         server="localhost", database="TestDB", username="testuser", password="testpass"
-    ) as conn:
-        result = await conn.query("SELECT DB_NAME() as current_db")
-        rows = result.rows()
-        for row in rows:
-            print(f"  Current Database: {row['current_db']}")
+    )
+    # A single statement doesn't need a pool: query_once opens one
+    # connection, runs the query and closes it
+    result = await conn.query_once("SELECT DB_NAME() as current_db")
+    rows = result.rows()
+    for row in rows:
+        print(f"  Current Database: {row['current_db']}")
 
 
 async def advanced_configuration_example():
@@ -106,24 +147,13 @@ async def advanced_configuration_example():
     print("\n🔹 Advanced Configuration Example")
     print("-" * 40)
 
-    # Configure connection pool
-    pool_config = PoolConfig(
-        max_connections=20,
-        min_connections=2,
-        acquire_timeout_seconds=30,
-        idle_timeout_seconds=600,
-    )
-
-    # Configure SSL/TLS
-    ssl_config = SslConfig(
-        encryption_level=EncryptionLevel.Required,
-        trust_server_certificate=False,
-        # certificate_path="/path/to/cert.pem"  # Optional certificate path
-    )
+    # Reuse the module-level pool and SSL/TLS configuration
+    pool_config = POOL_CONFIG
+    ssl_config = SSL_CONFIG
 
     print("🔒 Using advanced configuration:")
     print(
-        f"  Pool: {pool_config.min_connections}-{pool_config.max_connections} connections"
+        f"  Pool: {pool_config.min_idle}-{pool_config.max_size} connections"
     )
     print(f"  SSL: {ssl_config.encryption_level}")
 
@@ -143,82 +173,76 @@ async def advanced_configuration_example():
         for row in rows:
             print(f"  Connected to: {row['server_name']}.{row['database_name']}")
 
+        # Entering the context already opened min_idle connections in parallel;
+        # top the pool up before a burst so early requests skip the handshake
+        pooled = await conn.warm()
+        print(f"  Pool warmed to {pooled} connections")
+
 
-async def parameter_types_example():
+async def parameter_types_example(conn):
     """
     Example showing different parameter types and how to use them.
     """
     print("\n🔹 Parameter Types Example")
     print("-" * 40)
 
-    async with Connection(
-        "Server=localhost;Database=TestDB;User Id=testuser;Password=testpass;"
-    ) as conn:
-        # Various parameter types
-        print("📝 Testing different parameter types:")
-
-        # String parameters
-        result = await conn.query(
-            "SELECT @P1 as string_param, @P2 as unicode_param",
-            ["Hello World", "Unicode: ñáéíóú🚀"],
-        )
-        rows = result.rows()
-        for row in rows:
-            print(f"  Strings: {row['string_param']}, {row['unicode_param']}")
-
-        # Numeric parameters
-        result = await conn.query(
-            "SELECT @P1 as int_param, @P2 as float_param, @P3 as decimal_param",
-            [42, 3.14159, 99.99],
-        )
-        rows = result.rows()
-        for row in rows:
-            print(
-                f"  Numbers: {row['int_param']}, {row['float_param']}, {row['decimal_param']}"
-            )
-
-        # Boolean and None parameters
-        result = await conn.query(
-            "SELECT @P1 as bool_param, @P2 as null_param", [True, None]
-        )
-        rows = result.rows()
-        for row in rows:
-            print(f"  Special: {row['bool_param']}, {row['null_param']}")
-
-        # Date/Time parameters (as strings)
-        result = await conn.query(
-            "SELECT @P1 as date_param, @P2 as datetime_param",
-            ["2024-01-15", "2024-01-15 14:30:00"],
-        )
-        rows = result.rows()
-        for row in rows:
-            print(f"  Dates: {row['date_param']}, {row['datetime_param']}")
+    # Various parameter types
+    print("📝 Testing different parameter types:")
+
+    # Echo every parameter type from a single SELECT: one statement, one row,
+    # and the columns are split back into their groups client-side
+    result = await conn.query(
+        """
+        SELECT @P1 as string_param, @P2 as unicode_param,
+               @P3 as int_param, @P4 as float_param, @P5 as decimal_param,
+               @P6 as bool_param, @P7 as null_param,
+               @P8 as date_param, @P9 as datetime_param
+        """,
+        [
+            # String parameters
+            "Hello World", "Unicode: ñáéíóú🚀",
+            # Numeric parameters
+            42, 3.14159, 99.99,
+            # Boolean and None parameters
+            True, None,
+            # Date/Time parameters (as strings)
+            "2024-01-15", "2024-01-15 14:30:00",
+        ],
+    )
+    row = result[0]
+    print(f"  Strings: {row['string_param']}, {row['unicode_param']}")
+    print(
+        f"  Numbers: {row['int_param']}, {row['float_param']}, {row['decimal_param']}"
+    )
+    print(f"  Special: {row['bool_param']}, {row['null_param']}")
+    print(f"  Dates: {row['date_param']}, {row['datetime_param']}")
 
 
-async def batch_operations_example():
+async def batch_operations_example(conn):
     """
     Example showing efficient batch operations including bulk inserts.
     """
     print("\n🔹 Batch Operations Example")
     print("-" * 40)
 
-    async with Connection(
-        "Server=localhost;Database=TestDB;User Id=testuser;Password=testpass;"
-    ) as conn:
-        # Create a temporary table for testing
-        await conn.execute("""
-            IF OBJECT_ID('tempdb..#batch_test') IS NOT NULL
-                DROP TABLE #batch_test
+    # Create a scratch table for testing. It is a real table, not a #temp one:
+    # each call below may run on a different pooled connection (execute_batch
+    # even takes a dedicated one), and a #temp table only exists on the
+    # session that created it. It is dropped again when the example ends
+    await conn.execute_script("""
+        IF OBJECT_ID('dbo.fastmssql_batch_example', 'U') IS NOT NULL
+            DROP TABLE dbo.fastmssql_batch_example
                 
-            CREATE TABLE #batch_test (
-                id INT IDENTITY(1,1) PRIMARY KEY,
-                name NVARCHAR(100),
-                value DECIMAL(10,2),
-                created_date DATETIME2 DEFAULT GETDATE()
-            )
-        """)
-        print("✅ Created temporary table for batch testing")
+        CREATE TABLE dbo.fastmssql_batch_example (
+            id INT IDENTITY(1,1) PRIMARY KEY,
+            name NVARCHAR(100),
+            value DECIMAL(10,2),
+            created_date DATETIME2 DEFAULT GETDATE()
+        )
+    """)
+    print("✅ Created scratch table for batch testing")
 
+    try:
         # === BULK INSERT EXAMPLE ===
         print("\n📦 Bulk Insert Operation:")
 
@@ -238,33 +262,28 @@ async def batch_operations_example():
         ]
 
         # Perform bulk insert - much faster than individual INSERT statements
-        rows_inserted = await conn.bulk_insert("#batch_test", columns, bulk_data)
+        rows_inserted = await conn.bulk_insert("dbo.fastmssql_batch_example", columns, bulk_data)
         print(f"✅ Bulk inserted {rows_inserted} records in one operation")
 
         # === BATCH QUERIES EXAMPLE ===
         print("\n📊 Batch Query Operations:")
 
-        # Execute multiple queries in a single round-trip
-        batch_queries = [
-            ("SELECT COUNT(*) as total_records FROM #batch_test", None),
-            ("SELECT AVG(value) as avg_value FROM #batch_test", None),
-            (
-                "SELECT MAX(value) as max_value, MIN(value) as min_value FROM #batch_test",
-                None,
-            ),
-            (
-                "SELECT COUNT(*) as high_value_count FROM #batch_test WHERE value > @P1",
-                [3000.00],
-            ),
-        ]
-
-        results = await conn.query_batch(batch_queries)
+        # Independent SELECTs joined into one batch: query_results sends them
+        # in a single round-trip and returns one result per statement.
+        # (query_batch would run them one after another on one connection.)
+        results = await conn.query_results(
+            "SELECT COUNT(*) as total_records FROM dbo.fastmssql_batch_example; "
+            "SELECT AVG(value) as avg_value FROM dbo.fastmssql_batch_example; "
+            "SELECT MAX(value) as max_value, MIN(value) as min_value FROM dbo.fastmssql_batch_example; "
+            "SELECT COUNT(*) as high_value_count FROM dbo.fastmssql_batch_example WHERE value > @P1",
+            [3000.00],
+        )
 
         # Process batch results
-        total_records = results[0].rows()[0]["total_records"]
-        avg_value = results[1].rows()[0]["avg_value"]
+        total_records = results[0].scalar()
+        avg_value = results[1].scalar()
         max_min = results[2].rows()[0]
-        high_value_count = results[3].rows()[0]["high_value_count"]
+        high_value_count = results[3].scalar()
 
         print(f"  📈 Total Records: {total_records}")
         print(f"  📈 Average Value: ${avg_value:.2f}")
@@ -276,18 +295,20 @@ async def batch_operations_example():
         # === BATCH COMMANDS EXAMPLE ===
         print("\n🔧 Batch Command Operations:")
 
-        # Execute multiple commands in a single round-trip
+        # execute_batch runs the commands inside one BEGIN/COMMIT on a dedicated
+        # connection: they succeed or fail together, and the server flushes its
+        # log once at COMMIT instead of once per autocommitted statement
         batch_commands = [
             (
-                "UPDATE #batch_test SET value = value * 1.1 WHERE value < @P1",
+                "UPDATE dbo.fastmssql_batch_example SET value = value * 1.1 WHERE value < @P1",
                 [2000.00],
             ),  # 10% increase for lower values
             (
-                "INSERT INTO #batch_test (name, value) VALUES (@P1, @P2)",
+                "INSERT INTO dbo.fastmssql_batch_example (name, value) VALUES (@P1, @P2)",
                 ["Bonus Record", 5000.00],
             ),
             (
-                "UPDATE #batch_test SET created_date = DATEADD(day, -1, created_date) WHERE name LIKE @P1",
+                "UPDATE dbo.fastmssql_batch_example SET created_date = DATEADD(day, -1, created_date) WHERE name LIKE @P1",
                 ["%Bonus%"],
             ),
         ]
@@ -304,7 +325,7 @@ async def batch_operations_example():
                 COUNT(*) as final_count,
                 AVG(value) as final_avg_value,
                 MAX(value) as final_max_value
-            FROM #batch_test
+            FROM dbo.fastmssql_batch_example
         """)
 
         final_stats = verification_result.rows()[0]
@@ -316,22 +337,114 @@ async def batch_operations_example():
         # Show top records
         top_records_result = await conn.query("""
             SELECT TOP 3 name, value, created_date 
-            FROM #batch_test 
+            FROM dbo.fastmssql_batch_example 
             ORDER BY value DESC
         """)
 
         print("\n🏆 Top 3 Records by Value:")
-        for record in top_records_result.rows():
-            print(f"  {record['name']}: ${record['value']:.2f}")
+        print("\n".join(
+            f"  {record['name']}: ${record['value']:.2f}"
+            for record in top_records_result.rows()
+        ))
+    finally:
+        await conn.execute("DROP TABLE dbo.fastmssql_batch_example")
+
+    print("\n� Batch Operations Benefits:")
+    print("  • Reduced network round-trips")
+    print("  • Better performance for bulk operations")
+    print("  • Atomic execution for related operations")
+    print("  • Optimal resource utilization")
+
+
+async def sample_pool_stats(conn, history, interval=0.1):
+    """
+    Append a (elapsed_seconds, pool_stats) sample to `history` every `interval`.
+
+    Run it as a background task so observing the pool costs one call per
+    interval rather than one per query; cancel the task to stop sampling.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    while True:
+        history.append((loop.time() - started, await conn.pool_stats()))
+        await asyncio.sleep(interval)
+
+
+async def pool_monitoring_example():
+    """
+    Example showing how to watch pool usage while concurrent queries run.
+    """
+    print("\n🔹 Pool Monitoring Example")
+    print("-" * 40)
+
+    async with Connection(
+        CONN_STR,
+        pool_config=PoolConfig(max_size=4, min_idle=1),
+    ) as conn:
+        print(f"📊 Initial pool stats: {await conn.pool_stats()}")
+
+        async def run_query(query_id):
+            # WAITFOR keeps each connection checked out long enough to observe
+            await conn.query(
+                "WAITFOR DELAY '00:00:00.200'; SELECT @P1 as id", [query_id]
+            )
+            return query_id
+
+        # Sample the pool in the background instead of after every query
+        history = deque(maxlen=100)
+        sampler = asyncio.create_task(sample_pool_stats(conn, history))
+
+        # Native asyncio tasks share the pool directly; no executor threads needed
+        tasks = [asyncio.create_task(run_query(i)) for i in range(6)]
+        for finished in asyncio.as_completed(tasks):
+            print(f"  Query {await finished} done")
+
+        sampler.cancel()
+        try:
+            await sampler
+        except asyncio.CancelledError:
+            pass
+
+        # One sample per interval adds up quickly; format the whole timeline
+        # and write it once rather than paying a print() per sample
+        print("📈 Pool usage timeline:")
+        print(
+            "\n".join(
+                f"  {elapsed * 1000:6.0f} ms - active: {stats['active_connections']}, "
+                f"idle: {stats['idle_connections']}"
+                for elapsed, stats in history
+            )
+        )
+
 
-        print("\n� Batch Operations Benefits:")
-        print("  • Reduced network round-trips")
-        print("  • Better performance for bulk operations")
-        print("  • Atomic execution for related operations")
-        print("  • Optimal resource utilization")
+# Server errors that will fail the same way on every attempt: syntax error,
+# invalid column name, invalid object name
+UNRECOVERABLE_SQL_ERRORS = frozenset({102, 207, 208})
 
 
-async def error_handling_example():
+async def run_with_retry(operation, attempts=3, base_delay=0.05):
+    """
+    Await `operation()` and retry transient failures with jittered backoff.
+
+    Delays grow as base_delay * 2**attempt plus up to base_delay of random
+    jitter, so callers that failed together do not all retry together.
+    Errors listed in UNRECOVERABLE_SQL_ERRORS are raised immediately.
+    """
+    for attempt in range(attempts):
+        try:
+            return await operation()
+        except SqlError as e:
+            if e.code in UNRECOVERABLE_SQL_ERRORS or attempt == attempts - 1:
+                raise
+            delay = base_delay * (2**attempt) + random.random() * base_delay
+            logger.warning(
+                "retrying after SQL error",
+                extra={"attempt": attempt + 1, "code": e.code, "delay": delay},
+            )
+            await asyncio.sleep(delay)
+
+
+async def error_handling_example(conn):
     """
     Example showing proper error handling patterns.
     """
@@ -339,304 +452,363 @@ async def error_handling_example():
     print("-" * 40)
 
     try:
-        async with Connection(
-            "Server=localhost;Database=TestDB;User Id=testuser;Password=testpass;"
-        ) as conn:
+        # Examples 1-3 don't depend on each other, so run them concurrently
+        # on the pool and report each outcome in order
+        probes = [
             # Example 1: SQL syntax error
-            print("🚨 Testing SQL syntax error handling:")
-            try:
-                await conn.query("SELCT * FROM invalid_syntax")  # Intentional typo
-            except Exception as e:
-                print(f"  ✅ Caught SQL syntax error: {type(e).__name__}")
-
+            ("SQL syntax error", "SQL syntax",
+             conn.query("SELCT * FROM invalid_syntax")),  # Intentional typo
             # Example 2: Invalid table name
-            print("\n🚨 Testing invalid table error handling:")
-            try:
-                await conn.query("SELECT * FROM non_existent_table_12345")
-            except Exception as e:
-                print(f"  ✅ Caught table error: {type(e).__name__}")
-
+            ("invalid table error", "table",
+             conn.query("SELECT * FROM non_existent_table_12345")),
             # Example 3: Parameter mismatch
-            print("\n🚨 Testing parameter mismatch error handling:")
-            try:
-                await conn.query("SELECT @P1, @P2", [1])  # Missing second parameter
-            except Exception as e:
-                print(f"  ✅ Caught parameter error: {type(e).__name__}")
+            ("parameter mismatch error", "parameter",
+             conn.query("SELECT @P1, @P2", [1])),  # Missing second parameter
+        ]
+        outcomes = await asyncio.gather(
+            *(query for _, _, query in probes), return_exceptions=True
+        )
+        for i, ((title, kind, _), outcome) in enumerate(zip(probes, outcomes)):
+            spacer = "\n" if i else ""
+            print(f"{spacer}🚨 Testing {title} handling:")
+            if isinstance(outcome, Exception):
+                print(f"  ✅ Caught {kind} error: {type(outcome).__name__}")
+
+        # Example 4: Retry with backoff, but never retry a statement that
+        # can only fail again
+        print("\n🚨 Testing retry short-circuit on unrecoverable errors:")
+        try:
+            await run_with_retry(
+                lambda: conn.query("SELECT * FROM non_existent_table_12345")
+            )
+        except SqlError as e:
+            print(f"  ✅ Gave up immediately on error {e.code}")
 
-            print("\n✅ All error handling tests completed successfully")
+        print("\n✅ All error handling tests completed successfully")
 
     except Exception as e:
-        print(f"❌ Connection error: {e}")
+        print(f"❌ Unexpected error: {e}")
 
 
-async def performance_tips_example():
+async def pipelined(conn, queries, window=None):
+    """
+    Run independent (sql, params) queries with at most `window` in flight.
+
+    Each query borrows its own pooled connection, so throughput scales with
+    min(window, pool size) instead of being bounded by one round-trip at a time.
+    The window defaults to the pool's max_size: queueing more checkouts than the
+    pool can serve only adds waiting and risks pool acquire timeouts.
+    """
+    if window is None:
+        window = (await conn.pool_stats())["max_size"]
+    semaphore = asyncio.Semaphore(window)
+
+    async def run(sql, params):
+        async with semaphore:
+            return await conn.query(sql, params)
+
+    # A TaskGroup cancels the remaining queries as soon as one fails, rather
+    # than leaving them running against the pool after the error surfaces
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(run(sql, params)) for sql, params in queries]
+    return [task.result() for task in tasks]
+
+
+async def performance_tips_example(conn):
     """
     Example demonstrating performance optimization techniques.
     """
     print("\n🔹 Performance Optimization Tips")
     print("-" * 40)
 
-    async with Connection(
-        "Server=localhost;Database=TestDB;User Id=testuser;Password=testpass;"
-    ) as conn:
-        print("⚡ Performance Tips:")
-        print("1. Use parameterized queries (always!)")
-        print("2. Use appropriate connection pool settings")
-        print("3. Use result.rows() to get all results efficiently")
-        print("4. Batch operations when possible")
-        print("5. Use specific column names instead of SELECT *")
-
-        # Example: Efficient large result set processing
-        print("\n📊 Processing large result set efficiently:")
-
-        # Create test data
-        await conn.execute("""
-            IF OBJECT_ID('tempdb..#perf_test') IS NOT NULL
-                DROP TABLE #perf_test
+    print("⚡ Performance Tips:")
+    print("1. Use parameterized queries (always!)")
+    print("2. Use appropriate connection pool settings")
+    print("3. Use result.rows() to get all results efficiently")
+    print("4. Batch operations when possible")
+    print("5. Use specific column names instead of SELECT *")
+    print("6. Overlap independent queries instead of awaiting them one by one")
+
+    # Example: Efficient large result set processing
+    print("\n📊 Processing large result set efficiently:")
+
+    # Create test data in a real table (dropped at the end): the calls below
+    # may each use a different pooled connection, so a #temp table created
+    # by one of them would not be visible to the others
+    await conn.execute_script("""
+        IF OBJECT_ID('dbo.fastmssql_perf_example', 'U') IS NOT NULL
+            DROP TABLE dbo.fastmssql_perf_example
                 
-            CREATE TABLE #perf_test (
-                id INT IDENTITY(1,1) PRIMARY KEY,
-                data NVARCHAR(50)
-            )
-        """)
+        CREATE TABLE dbo.fastmssql_perf_example (
+            id INT IDENTITY(1,1) PRIMARY KEY,
+            data NVARCHAR(50)
+        )
+    """)
 
-        # Insert test data
-        for i in range(10):
-            await conn.execute(
-                "INSERT INTO #perf_test (data) VALUES (@P1)", [f"Test data row {i + 1}"]
-            )
+    try:
+        # Insert test data with one multi-row INSERT instead of a round-trip per row
+        await conn.bulk_insert(
+            "dbo.fastmssql_perf_example", ["data"], [[f"Test data row {i + 1}"] for i in range(10)]
+        )
 
-        # Efficient processing: stream results instead of loading all into memory
+        # Efficient processing: stream results instead of loading all into memory.
+        # query_iter hands rows over as they arrive, so memory stays flat and
+        # the first row is processed before the last one has been sent
+        # Lines to show are collected and printed once after the loop, so no
+        # console I/O runs between rows
         print("  📈 Processing results efficiently:")
-        result = await conn.query("SELECT id, data FROM #perf_test ORDER BY id")
-        rows = result.rows()
-        row_count = len(rows)
+        row_count = 0
+        shown = []
+        async for row in conn.query_iter("SELECT id, data FROM dbo.fastmssql_perf_example ORDER BY id"):
+            row_count += 1
+            if row_count <= 3:  # Show first 3 rows
+                # Unpack every selected column in one call instead of one
+                # lookup per field
+                row_id, data = row.values()
+                shown.append(f"    Row {row_id}: {data}")
+
+        print("\n".join(shown))
+        print(f"  ✅ Processed {row_count} rows efficiently")
 
-        for i, row in enumerate(rows):
-            if i < 3:  # Show first 3 rows
-                print(f"    Row {row['id']}: {row['data']}")
+        # Reading one field across every row? Pull the column in a single call
+        # instead of building a row object per row and indexing it
+        result = await conn.query("SELECT id FROM dbo.fastmssql_perf_example")
+        ids = result.column("id")
+        print(f"  ✅ Read {len(ids)} ids in one column call (sum: {sum(ids)})")
+    finally:
+        await conn.execute("DROP TABLE dbo.fastmssql_perf_example")
 
-        print(f"  ✅ Processed {row_count} rows efficiently")
+    # Example: Overlapping independent queries
+    print("\n🚀 Pipelining independent queries:")
+    lookups = [("SELECT @P1 as lookup_id", [i]) for i in range(100)]
+    results = await pipelined(conn, lookups)
+    print(f"  ✅ Completed {len(results)} lookups, bounded by the pool size")
 
+    # query_batch runs a group back to back on one pooled connection
+    results = await conn.query_batch(lookups[:32])
+    print(f"  ✅ Fetched {len(results)} result sets in one batch")
 
-async def bulk_insert_example():
+
+async def bulk_insert_example(conn):
     """
     Dedicated example for high-performance bulk insert operations.
     """
     print("\n🔹 High-Performance Bulk Insert Example")
     print("-" * 40)
 
-    async with Connection(
-        "Server=localhost;Database=TestDB;User Id=testuser;Password=testpass;"
-    ) as conn:
-        # Create a table optimized for bulk inserts
-        await conn.execute("""
-            IF OBJECT_ID('sales_data') IS NOT NULL
-                DROP TABLE sales_data
+    # Create a table optimized for bulk inserts
+    await conn.execute_script("""
+        IF OBJECT_ID('sales_data') IS NOT NULL
+            DROP TABLE sales_data
                 
-            CREATE TABLE sales_data (
-                id INT IDENTITY(1,1) PRIMARY KEY,
-                product_code NVARCHAR(20),
-                product_name NVARCHAR(100),
-                quantity INT,
-                unit_price DECIMAL(10,2),
-                sale_date DATE,
-                customer_id INT,
-                total_amount AS (quantity * unit_price) PERSISTED
-            )
-        """)
-        print("✅ Created sales_data table for bulk insert demonstration")
-
-        # Generate sample sales data (simulating a data import scenario)
-        print("📈 Generating sample sales data...")
-
-        import random
-        from datetime import date, timedelta
-
-        products = [
-            ("PRD001", "Wireless Headphones", 299.99),
-            ("PRD002", "Bluetooth Speaker", 89.99),
-            ("PRD003", "USB-C Cable", 19.99),
-            ("PRD004", "Power Bank", 49.99),
-            ("PRD005", "Phone Case", 24.99),
-            ("PRD006", "Screen Protector", 12.99),
-            ("PRD007", "Car Charger", 34.99),
-            ("PRD008", "Wireless Mouse", 39.99),
-            ("PRD009", "Keyboard", 79.99),
-            ("PRD010", "Monitor Stand", 159.99),
-        ]
-
-        # Prepare bulk data for insert
-        columns = [
-            "product_code",
-            "product_name",
-            "quantity",
-            "unit_price",
-            "sale_date",
-            "customer_id",
-        ]
-        sales_data = []
-
-        # Generate 1000 sales records
-        base_date = date.today() - timedelta(days=30)
-        for i in range(1000):
-            product_code, product_name, price = random.choice(products)
-            quantity = random.randint(1, 5)
-            sale_date = (base_date + timedelta(days=random.randint(0, 30))).strftime(
-                "%Y-%m-%d"
-            )
-            customer_id = random.randint(1000, 9999)
-
-            sales_data.append(
-                [product_code, product_name, quantity, price, sale_date, customer_id]
-            )
-
-        print(f"📊 Prepared {len(sales_data)} sales records for bulk insert")
-
-        # Perform bulk insert with timing
-        import time
-
-        start_time = time.time()
-
-        rows_inserted = await conn.bulk_insert("sales_data", columns, sales_data)
-
-        insert_time = time.time() - start_time
-
-        print(f"🚀 Bulk inserted {rows_inserted} records in {insert_time:.3f} seconds")
-        print(f"⚡ Performance: {rows_inserted / insert_time:.0f} records/second")
-
-        # Verify and analyze the inserted data
-        print("\n📊 Data Analysis:")
-
-        analysis_queries = [
-            ("SELECT COUNT(*) as total_sales FROM sales_data", None),
-            (
-                "SELECT COUNT(DISTINCT product_code) as unique_products FROM sales_data",
-                None,
-            ),
-            (
-                "SELECT COUNT(DISTINCT customer_id) as unique_customers FROM sales_data",
-                None,
-            ),
-            ("SELECT SUM(total_amount) as total_revenue FROM sales_data", None),
-            ("SELECT AVG(total_amount) as avg_order_value FROM sales_data", None),
-        ]
-
-        analysis_results = await conn.query_batch(analysis_queries)
-
-        total_sales = analysis_results[0].rows()[0]["total_sales"]
-        unique_products = analysis_results[1].rows()[0]["unique_products"]
-        unique_customers = analysis_results[2].rows()[0]["unique_customers"]
-        total_revenue = analysis_results[3].rows()[0]["total_revenue"]
-        avg_order_value = analysis_results[4].rows()[0]["avg_order_value"]
+        CREATE TABLE sales_data (
+            id INT IDENTITY(1,1) PRIMARY KEY,
+            product_code NVARCHAR(20),
+            product_name NVARCHAR(100),
+            quantity INT,
+            unit_price DECIMAL(10,2),
+            sale_date DATE,
+            customer_id INT,
+            total_amount AS (quantity * unit_price) PERSISTED
+        )
+    """)
+    print("✅ Created sales_data table for bulk insert demonstration")
+
+    # Generate sample sales data (simulating a data import scenario)
+    print("📈 Generating sample sales data...")
+
+    import random
+    from datetime import date, timedelta
+
+    products = [
+        ("PRD001", "Wireless Headphones", 299.99),
+        ("PRD002", "Bluetooth Speaker", 89.99),
+        ("PRD003", "USB-C Cable", 19.99),
+        ("PRD004", "Power Bank", 49.99),
+        ("PRD005", "Phone Case", 24.99),
+        ("PRD006", "Screen Protector", 12.99),
+        ("PRD007", "Car Charger", 34.99),
+        ("PRD008", "Wireless Mouse", 39.99),
+        ("PRD009", "Keyboard", 79.99),
+        ("PRD010", "Monitor Stand", 159.99),
+    ]
 
-        print(f"  📈 Total Sales Records: {total_sales:,}")
-        print(f"  📦 Unique Products: {unique_products}")
-        print(f"  👥 Unique Customers: {unique_customers}")
-        print(f"  💰 Total Revenue: ${total_revenue:,.2f}")
-        print(f"  🛒 Average Order Value: ${avg_order_value:.2f}")
+    # Prepare bulk data for insert
+    columns = [
+        "product_code",
+        "product_name",
+        "quantity",
+        "unit_price",
+        "sale_date",
+        "customer_id",
+    ]
 
-        # Show top-selling products
-        top_products_result = await conn.query("""
-            SELECT 
+    # Generate 1000 sales records. The 31 candidate dates are built once up
+    # front, and date objects are bound natively, so no per-row formatting.
+    base_date = date.today() - timedelta(days=30)
+    sale_dates = [base_date + timedelta(days=offset) for offset in range(31)]
+    sales_data = []
+    for _ in range(1000):
+        product_code, product_name, price = random.choice(products)
+        sales_data.append(
+            [
+                product_code,
                 product_name,
-                SUM(quantity) as total_quantity_sold,
-                SUM(total_amount) as total_product_revenue,
-                COUNT(*) as number_of_sales
-            FROM sales_data
-            GROUP BY product_code, product_name
-            ORDER BY total_product_revenue DESC
-        """)
-
-        print("\n🏆 Top-Selling Products by Revenue:")
-        for i, product in enumerate(top_products_result.rows()[:5], 1):
-            print(
-                f"  {i}. {product['product_name']}: ${product['total_product_revenue']:,.2f} "
-                f"({product['total_quantity_sold']} units, {product['number_of_sales']} sales)"
-            )
-
-        # Performance comparison note
-        print("\n💡 Performance Note:")
-        print(
-            f"  Individual INSERT statements would require {len(sales_data)} round-trips"
+                random.randint(1, 5),
+                price,
+                random.choice(sale_dates),
+                random.randint(1000, 9999),
+            ]
         )
-        print("  Bulk insert completed in 1 round-trip - significant performance gain!")
+
+    print(f"📊 Prepared {len(sales_data)} sales records for bulk insert")
+
+    # Perform bulk insert with timing; perf_counter is monotonic and
+    # high-resolution, unlike wall-clock time.time()
+    start_time = time.perf_counter()
+    rows_inserted = await conn.bulk_insert("sales_data", columns, sales_data)
+    insert_time = time.perf_counter() - start_time
+
+    print(f"🚀 Bulk inserted {rows_inserted} records in {insert_time:.3f} seconds")
+    print(f"⚡ Performance: {rows_inserted / insert_time:.0f} records/second")
+
+    # Verify and analyze the inserted data
+    print("\n📊 Data Analysis:")
+
+    # Independent aggregates over the same table fit in one statement:
+    # one round-trip and one scan instead of five
+    analysis = (
+        await conn.query("""
+        SELECT
+            COUNT(*) as total_sales,
+            COUNT(DISTINCT product_code) as unique_products,
+            COUNT(DISTINCT customer_id) as unique_customers,
+            SUM(total_amount) as total_revenue,
+            AVG(total_amount) as avg_order_value
+        FROM sales_data
+    """)
+    )[0]
+
+    total_sales = analysis["total_sales"]
+    unique_products = analysis["unique_products"]
+    unique_customers = analysis["unique_customers"]
+    total_revenue = analysis["total_revenue"]
+    avg_order_value = analysis["avg_order_value"]
+
+    print(f"  📈 Total Sales Records: {total_sales:,}")
+    print(f"  📦 Unique Products: {unique_products}")
+    print(f"  👥 Unique Customers: {unique_customers}")
+    print(f"  💰 Total Revenue: ${total_revenue:,.2f}")
+    print(f"  🛒 Average Order Value: ${avg_order_value:.2f}")
+
+    # Show top-selling products
+    # TOP 5 keeps the other products on the server, and iterating the result
+    # converts each row as it is reached instead of building a list up front
+    top_products_result = await conn.query("""
+        SELECT TOP 5
+            product_name,
+            SUM(quantity) as total_quantity_sold,
+            SUM(total_amount) as total_product_revenue,
+            COUNT(*) as number_of_sales
+        FROM sales_data
+        GROUP BY product_code, product_name
+        ORDER BY total_product_revenue DESC
+    """)
+
+    print("\n🏆 Top-Selling Products by Revenue:")
+    for i, product in enumerate(top_products_result, 1):
         print(
-            f"  Estimated time savings: ~{(len(sales_data) * 0.01):.1f} seconds for individual inserts"
+            f"  {i}. {product['product_name']}: ${product['total_product_revenue']:,.2f} "
+            f"({product['total_quantity_sold']} units, {product['number_of_sales']} sales)"
         )
 
-        # Cleanup
-        await conn.execute("DROP TABLE sales_data")
-        print("\n🧹 Cleanup completed")
+    # Performance comparison note
+    print("\n💡 Performance Note:")
+    print(
+        f"  Individual INSERT statements would require {len(sales_data)} round-trips"
+    )
+    print("  Bulk insert completed in 1 round-trip - significant performance gain!")
+    print(
+        f"  Estimated time savings: ~{(len(sales_data) * 0.01):.1f} seconds for individual inserts"
+    )
 
+    # Cleanup
+    await conn.execute("DROP TABLE sales_data")
+    print("\n🧹 Cleanup completed")
 
-async def ddl_operations_example():
+
+async def ddl_operations_example(conn):
     """
     Example showing DDL (Data Definition Language) operations.
     """
     print("\n🔹 DDL Operations Example")
     print("-" * 40)
 
-    async with Connection(
-        "Server=localhost;Database=TestDB;User Id=testuser;Password=testpass;"
-    ) as conn:
-        # Create table
-        print("🏗️ Creating table...")
-        await conn.execute("""
-            IF OBJECT_ID('demo_products') IS NOT NULL
-                DROP TABLE demo_products
+    # Create table
+    print("🏗️ Creating table...")
+    await conn.execute_script("""
+        IF OBJECT_ID('demo_products') IS NOT NULL
+            DROP TABLE demo_products
                 
-            CREATE TABLE demo_products (
-                product_id INT IDENTITY(1,1) PRIMARY KEY,
-                product_name NVARCHAR(100) NOT NULL,
-                price DECIMAL(10,2) NOT NULL,
-                category_id INT,
-                created_date DATETIME2 DEFAULT GETDATE(),
-                is_active BIT DEFAULT 1
-            )
-        """)
-        print("✅ Table 'demo_products' created")
-
-        # Create index
-        await conn.execute("""
-            CREATE INDEX IX_demo_products_category 
-            ON demo_products (category_id)
-        """)
-        print("✅ Index created")
-
-        # Insert sample data
-        products = [
-            ("Laptop Pro", 1299.99, 1),
-            ("Wireless Mouse", 29.99, 2),
-            ("USB Cable", 9.99, 2),
-            ("Monitor 24inch", 299.99, 1),
-        ]
-
-        for name, price, category in products:
-            await conn.execute(
-                "INSERT INTO demo_products (product_name, price, category_id) VALUES (@P1, @P2, @P3)",
-                [name, price, category],
-            )
+        CREATE TABLE demo_products (
+            product_id INT IDENTITY(1,1) PRIMARY KEY,
+            product_name NVARCHAR(100) NOT NULL,
+            price DECIMAL(10,2) NOT NULL,
+            category_id INT,
+            created_date DATETIME2 DEFAULT GETDATE(),
+            is_active BIT DEFAULT 1
+        )
+    """)
+    print("✅ Table 'demo_products' created")
+
+    # Create index
+    await conn.execute("""
+        CREATE INDEX IX_demo_products_category 
+        ON demo_products (category_id)
+    """)
+    print("✅ Index created")
+
+    # Insert sample data
+    products = [
+        ["Laptop Pro", 1299.99, 1],
+        ["Wireless Mouse", 29.99, 2],
+        ["USB Cable", 9.99, 2],
+        ["Monitor 24inch", 299.99, 1],
+    ]
 
-        print("✅ Sample data inserted")
+    # One multi-row INSERT (chunked by the driver) instead of a round-trip per product
+    await conn.bulk_insert(
+        "demo_products",
+        ["product_name", "price", "category_id"],
+        products,
+    )
 
-        print("\n📊 Product Inventory:")
-        result = await conn.query("""
-            SELECT product_id, product_name, price, 
-                   FORMAT(price, 'C') as formatted_price,
-                   created_date
-            FROM demo_products 
-            ORDER BY price DESC
-        """)
-        rows = result.rows()
-        for row in rows:
-            print(
-                f"  {row['product_name']}: {row['formatted_price']} (ID: {row['product_id']})"
+    print("✅ Sample data inserted")
+
+    print("\n📊 Product Inventory:")
+    result = await conn.query("""
+        SELECT product_id, product_name, price, 
+               FORMAT(price, 'C') as formatted_price,
+               created_date
+        FROM demo_products 
+        ORDER BY price DESC
+    """)
+    # Scan the result column-wise: one list per column, no row objects
+    inventory = result.to_columns()
+    print(
+        "\n".join(
+            f"  {name}: {price} (ID: {product_id})"
+            for name, price, product_id in zip(
+                inventory["product_name"],
+                inventory["formatted_price"],
+                inventory["product_id"],
             )
+        )
+    )
 
-        # Clean up
-        await conn.execute("DROP TABLE demo_products")
-        print("\n🧹 Cleanup completed")
+    # Clean up
+    await conn.execute("DROP TABLE demo_products")
+    print("\n🧹 Cleanup completed")
 
 
 async def main():
@@ -649,10 +821,15 @@ async def main():
     print("Built with Rust for maximum performance and safety")
     print("=" * 50)
 
-    examples = [
-        ("Basic Usage", basic_usage_example),
+    # These examples demonstrate their own connection setup and open it themselves
+    standalone_examples = [
         ("Connection Configuration", connection_configuration_example),
         ("Advanced Configuration", advanced_configuration_example),
+        ("Pool Monitoring", pool_monitoring_example),
+    ]
+    # The rest share one pool, so the login and warm-up are paid once for all
+    shared_pool_examples = [
+        ("Basic Usage", basic_usage_example),
         ("Parameter Types", parameter_types_example),
         ("Batch Operations", batch_operations_example),
         ("High-Performance Bulk Insert", bulk_insert_example),
@@ -662,7 +839,7 @@ async def main():
     ]
 
     print("\n📋 Available Examples:")
-    for i, (name, _) in enumerate(examples, 1):
+    for i, (name, _) in enumerate(standalone_examples + shared_pool_examples, 1):
         print(f"  {i}. {name}")
 
     print("\n" + "=" * 50)
@@ -671,17 +848,30 @@ async def main():
     print("=" * 50)
 
     # Uncomment the following lines to run examples (requires real database)
-    # for name, example_func in examples:
+    # for name, example_func in standalone_examples:
     #     try:
     #         await example_func()
     #     except Exception as e:
     #         print(f"\n❌ Error in {name}: {e}")
     #         print("   (This is expected without a real database connection)")
+    #
+    # async with Connection(CONN_STR, pool_config=POOL_CONFIG) as conn:
+    #     # Entering opened min_idle connections; top the pool up to max_size
+    #     # in parallel so the concurrent examples don't queue on handshakes
+    #     await conn.warm()
+    #     for name, example_func in shared_pool_examples:
+    #         try:
+    #             await example_func(conn)
+    #         except Exception as e:
+    #             print(f"\n❌ Error in {name}: {e}")
+    #             print("   (This is expected without a real database connection)")
 
     print("\n✅ Example definitions loaded successfully!")
     print("💡 Uncomment the example execution code to run with a real database.")
 
 
 if __name__ == "__main__":
-    # Run the examples
-    asyncio.run(main())
+    # Run the examples, on uvloop when it is available
+    loop_factory = uvloop_loop_factory()
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -15,11 +15,13 @@ from .fastmssql import (
     SqlConnectionError,
     EncryptionLevel,
     FastRow,
+    FrozenParameters,
     Parameter,
     Parameters,
     PoolConfig,
     ProtocolError,
     QueryStream,
+    RowStream,
     SqlError,
     SslConfig,
     TlsError,
@@ -58,7 +60,8 @@ class Connection:
         """Get connection pool statistics.
 
         Returns a dict with keys: connected, connections, idle_connections,
-        active_connections, max_size, min_idle
+        active_connections, max_size, min_idle, closed_idle_timeout,
+        closed_max_lifetime
         """
         return await self._conn.pool_stats()
 
@@ -196,11 +199,13 @@ __all__ = [
     "SqlConnectionError",
     "EncryptionLevel",
     "FastRow",
+    "FrozenParameters",
     "Parameter",
     "Parameters",
     "PoolConfig",
     "ProtocolError",
     "QueryStream",
+    "RowStream",
     "SqlError",
     "SslConfig",
     "TlsError",
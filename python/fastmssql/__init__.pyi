@@ -7,11 +7,13 @@ from .fastmssql import (
     ConversionError,
     EncryptionLevel,
     FastRow,
+    FrozenParameters,
     Parameter,
     Parameters,
     PoolConfig,
     ProtocolError,
     QueryStream,
+    RowStream,
     SqlConnectionError,
     SqlError,
     SslConfig,
@@ -75,7 +77,10 @@ class Connection:
             username: Username for SQL authentication (required when using individual parameters)
             password: Password for SQL authentication
             pool_config: Connection pool configuration
-            ssl_config: SSL/TLS configuration
+            ssl_config: SSL/TLS configuration. If neither this nor ``Encrypt=`` in the
+                connection string is given and the server is local (``localhost``,
+                ``(local)``, ``.``, ``127.0.0.0/8``, ``::1``), only the login is
+                encrypted. Pass one explicitly when tunnelling to a remote server
             azure_credential: Azure Active Directory credential for authentication
             application_intent: Sets ApplicationIntent to "ReadOnly" or "ReadWrite" (default: ReadWrite)
             port: TCP port number (default: 1433)
@@ -110,6 +115,10 @@ class Connection:
         Execute SELECT query that returns rows as an async stream.
 
         Returns a QueryStream for memory-efficient iteration over large result sets.
+        Always sent through sp_executesql, with or without parameters, so session
+        state the SQL sets (``#temp`` tables, ``SET`` options, ``USE``) ends with
+        the call and never reaches the next borrower of the pooled connection.
+        Use ``simple_query()`` or ``execute_script()`` for a plain SQL batch.
 
         Args:
             sql: SQL query with @P1, @P2, etc. placeholders for parameters
@@ -119,6 +128,23 @@ class Connection:
         """
         ...
 
+    def execute_script(self, sql: str) -> Coroutine[Any, Any, None]:
+        """
+        Run a multi-statement script as a single plain SQL batch.
+
+        ``execute()`` wraps its SQL in ``sp_executesql``, so a ``#temp`` table
+        created there is dropped when the call returns. ``execute_script()``
+        sends the text as-is, in one round trip, so objects it creates stay on
+        the session. That session is a single pooled connection: later calls
+        may run on another one and not see those objects, so use a real table
+        (or one ``Transaction``) for data shared across calls. Statements must
+        not use @P placeholders. Raises if any statement fails.
+
+        Args:
+            sql: One or more statements, e.g. a drop-if-exists plus CREATE TABLE
+        """
+        ...
+
     def simple_query(
         self,
         sql: str,
@@ -128,6 +154,10 @@ class Connection:
 
         Only use this when required (creating stored procedures may require this in certain cases)
 
+        The text runs as a plain batch in session scope, so ``#temp`` tables,
+        ``SET`` options, ``USE`` and open transactions it leaves behind stay on
+        the pooled connection and reach whichever caller borrows it next.
+
         Returns a QueryStream for memory-efficient iteration over large result sets.
 
         Args:
@@ -137,6 +167,27 @@ class Connection:
         """
         ...
 
+    def execute_scalar(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+    ) -> Coroutine[Any, Any, Any]:
+        """
+        Execute a query and return the first column of its first row.
+
+        Only that one value is converted to Python; the rest of the response
+        is read and discarded. Cheaper than ``(await query(...)).rows()[0][0]``
+        for ``COUNT(*)``/``MAX()``-style probes.
+
+        Args:
+            sql: SQL query with @P1, @P2, etc. placeholders
+            params: List of parameter values in order
+
+        Returns:
+            The value, or ``None`` if the query returned no rows
+        """
+        ...
+
     def execute(
         self,
         sql: str,
@@ -145,6 +196,10 @@ class Connection:
         """
         Execute INSERT/UPDATE/DELETE/DDL command.
 
+        Always sent through sp_executesql, with or without parameters, so
+        ``#temp`` tables it creates are dropped when the call returns. Use
+        ``execute_script()`` for setup that must outlive the call.
+
         Args:
             sql: SQL command with @P1, @P2, etc. placeholders
             params: List of parameter values in order
@@ -161,6 +216,11 @@ class Connection:
         """
         Execute multiple commands in a single batch for better performance.
 
+        The commands run in one transaction on a dedicated (non-pooled)
+        connection: all of them commit together, or all are rolled back if
+        one fails. Because the connection is not from the pool, ``#temp``
+        tables created on pooled connections are not visible to them.
+
         Args:
             commands: List of (sql, params) tuples
 
@@ -174,14 +234,23 @@ class Connection:
         table: str,
         columns: List[str],
         data: List[List[Any]],
-    ) -> Coroutine[Any, Any, None]:
+    ) -> Coroutine[Any, Any, int]:
         """
         High-performance bulk insert for large datasets.
 
+        Rows are sent as parameterized multi-row ``INSERT ... VALUES`` statements
+        on one pooled connection, each carrying as many rows as fit in SQL
+        Server's limits (2100 parameters, 1000 rows per VALUES list). A load
+        costs one round trip per chunk rather than one per row. Each chunk
+        commits on its own, so a failure part-way leaves earlier chunks in place.
+
         Args:
             table: Target table name (can be schema-qualified)
             columns: List of column names
             data: List of rows, each row is a list of values
+
+        Returns:
+            Number of rows inserted
         """
         ...
 
@@ -190,7 +259,10 @@ class Connection:
         queries: List[str] | List[Tuple[str, Optional[List[Any]]]],
     ) -> Coroutine[Any, Any, List[QueryStream]]:
         """
-        Execute multiple SELECT queries in a single batch.
+        Execute multiple SELECT queries one after another on one pooled connection.
+
+        Each query is its own round trip. To send several statements in a
+        single round trip, join them into one batch and use ``query_results()``.
 
         Args:
             queries: List of (sql, params) tuples or just sql strings
@@ -200,6 +272,91 @@ class Connection:
         """
         ...
 
+    def query_once(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+    ) -> Coroutine[Any, Any, QueryStream]:
+        """
+        Run a single query on a dedicated connection, then close it.
+
+        Does not create the connection pool, so it can be awaited without
+        entering the ``async with`` block. Use it for one-off statements;
+        anything that runs more than one query should use the pool.
+        Connecting (TCP, authentication and login) is bounded by the pool
+        config's ``connection_timeout_secs`` (30 seconds if unset) and raises
+        ``SqlConnectionError`` when it runs out.
+
+        Args:
+            sql: SQL query, with @P1, @P2, ... placeholders
+            params: Optional list of parameter values
+
+        Returns:
+            QueryStream with the first result set
+        """
+        ...
+
+    def query_iter(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+    ) -> RowStream:
+        """
+        Stream the first result set row by row as it arrives from the server.
+
+        Unlike ``query()``, rows are not buffered up front: use
+        ``async for row in conn.query_iter(sql, params)``. At most a small,
+        fixed number of rows is held in memory, and the first row can be
+        processed before the rest of the result set has arrived. One pooled
+        connection stays checked out until the rows run out or the stream
+        is dropped.
+
+        Args:
+            sql: SQL query with @P1, @P2, etc. placeholders for parameters
+            params: List of parameter values in order
+
+        Returns:
+            RowStream yielding FastRow objects
+        """
+        ...
+
+    def query_results(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+    ) -> Coroutine[Any, Any, List[QueryStream]]:
+        """
+        Execute a multi-statement batch and return every result set.
+
+        Unlike ``query()``, which keeps only the first result set, this sends
+        all statements in one round trip and returns one QueryStream per
+        result set, in order.
+
+        Args:
+            sql: One or more statements separated by ``;``
+            params: Optional list of parameter values shared by the batch
+
+        Returns:
+            List of QueryStream objects, one per result set
+        """
+        ...
+
+    def warm(self, connections: Optional[int] = None) -> Coroutine[Any, Any, int]:
+        """
+        Pre-open pooled connections concurrently ahead of a burst of work.
+
+        Entering the connection already warms ``min_idle`` connections. This
+        tops the pool up to ``connections`` (default and maximum: the pool's
+        ``max_size``) in parallel, so the handshakes overlap instead of being
+        paid one by one by the first queries. Connections already open,
+        including ones checked out elsewhere, count toward the target, so
+        only the shortfall is opened and warm() never waits on them.
+
+        Returns:
+            Total number of connections held by the pool afterwards.
+        """
+        ...
+
     def pool_stats(self) -> Coroutine[Any, Any, Dict[str, int | bool | None]]:
         """
         Get connection pool statistics.
@@ -211,6 +368,26 @@ class Connection:
         - active_connections (int): Number of connections currently in use
         - max_size (int): Maximum pool size
         - min_idle (int | None): Minimum idle connections to maintain
+        - closed_idle_timeout (int): Connections closed for exceeding idle_timeout
+        - closed_max_lifetime (int): Connections closed for exceeding max_lifetime
+        """
+        ...
+
+    def wait_for_eviction(
+        self, timeout_secs: float = 60.0
+    ) -> Coroutine[Any, Any, int]:
+        """
+        Wait until the pool closes a connection for idle timeout or max lifetime.
+
+        Resolves as soon as bb8's reaper evicts a connection (checked every
+        50 ms), instead of sleeping through a worst-case timeout. The reaper
+        itself runs periodically, so an eviction is seen on its next pass.
+
+        Args:
+            timeout_secs: Maximum time to wait
+
+        Returns:
+            Number of connections evicted, or 0 if none were before the timeout
         """
         ...
 
@@ -330,11 +507,13 @@ __all__ = [
     "Connection",
     "EncryptionLevel",
     "FastRow",
+    "FrozenParameters",
     "Parameter",
     "Parameters",
     "PoolConfig",
     "ProtocolError",
     "QueryStream",
+    "RowStream",
     "SqlConnectionError",
     "SqlError",
     "SslConfig",
@@ -29,20 +29,26 @@ async def test_azure_auth():
             database=os.getenv("AZURE_SQL_DATABASE"),
             azure_credential=azure_cred
         ) as conn:
+            # The three probes are independent, so send them as one batch:
+            # one round trip to Azure SQL instead of three
+            identity, databases, param_test = await conn.query_results(
+                "SELECT GETDATE() as current_dt, USER_NAME() as user_name; "
+                "SELECT name FROM sys.databases WHERE database_id <= 5; "
+                "SELECT @P1 as test_param",
+                ["Hello Azure!"],
+            )
+
             # Test basic connection
-            result = await conn.query("SELECT GETDATE() as current_dt, USER_NAME() as user_name")
-            for row in result.rows():
+            for row in identity.rows():
                 print(f"✅ Connected! Time: {row['current_dt']}, User: {row['user_name']}")
             
             # Test database operations
-            result = await conn.query("SELECT name FROM sys.databases WHERE database_id <= 5")
             print("\n📊 Available databases:")
-            for row in result.rows():
+            for row in databases.rows():
                 print(f"   - {row['name']}")
             
             # Test parameterized query
-            result = await conn.query("SELECT @P1 as test_param", ["Hello Azure!"])
-            for row in result.rows():
+            for row in param_test.rows():
                 print(f"\n🧪 Parameter test: {row['test_param']}")
             
             # Test connection pool stats
@@ -3,9 +3,11 @@ use pyo3::prelude::*;
 use reqwest::Client;
 use serde_json::Value;
 use std::collections::HashMap;
+use std::collections::hash_map::RandomState;
 use std::fmt;
+use std::hash::BuildHasher;
 use std::path::Path;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use std::time::{Duration, Instant};
 use tiberius::AuthMethod;
 use tokio::sync::{Mutex, RwLock};
@@ -52,6 +54,46 @@ impl Drop for CachedToken {
     }
 }
 
+/// Token cache and single-flight refresh lock shared by equivalent credentials
+type TokenSlot = (Arc<RwLock<Option<CachedToken>>>, Arc<Mutex<()>>);
+
+/// Identifies credentials that would fetch the same token. Service principal
+/// secrets are keyed by a process-local hash, so the secret is never stored here.
+#[derive(PartialEq, Eq, Hash)]
+enum TokenCacheKey {
+    ServicePrincipal {
+        tenant_id: String,
+        client_id: String,
+        secret_hash: u64,
+    },
+    ManagedIdentity {
+        client_id: Option<String>,
+    },
+    DefaultAzure,
+}
+
+static SHARED_TOKEN_SLOTS: OnceLock<std::sync::Mutex<HashMap<TokenCacheKey, TokenSlot>>> =
+    OnceLock::new();
+static SECRET_HASHER: OnceLock<RandomState> = OnceLock::new();
+
+/// Return the process-wide token slot for `key`, creating it on first use.
+///
+/// Credentials built separately with the same identity (e.g. one per
+/// Connection) share one cached token and one refresh lock, so only the first
+/// of them pays the round trip to Entra ID, IMDS or the Azure CLI.
+fn shared_token_slot(key: TokenCacheKey) -> TokenSlot {
+    let slots = SHARED_TOKEN_SLOTS.get_or_init(Default::default);
+    let mut slots = slots.lock().unwrap_or_else(|poisoned| poisoned.into_inner());
+    let (token_cache, refresh_mutex) = slots
+        .entry(key)
+        .or_insert_with(|| (Arc::new(RwLock::new(None)), Arc::new(Mutex::new(()))));
+    (Arc::clone(token_cache), Arc::clone(refresh_mutex))
+}
+
+fn hash_secret(secret: &str) -> u64 {
+    SECRET_HASHER.get_or_init(RandomState::new).hash_one(secret)
+}
+
 #[pyclass(name = "AzureCredentialType", from_py_object)] // <-- Explicit opt-in
 #[derive(Clone, Debug, PartialEq)]
 pub enum AzureCredentialType {
@@ -137,6 +179,12 @@ impl PyAzureCredential {
         client_secret: String,
         tenant_id: String,
     ) -> PyResult<Self> {
+        let (token_cache, refresh_mutex) = shared_token_slot(TokenCacheKey::ServicePrincipal {
+            tenant_id: tenant_id.clone(),
+            client_id: client_id.clone(),
+            secret_hash: hash_secret(&client_secret),
+        });
+
         let mut config = HashMap::new();
         config.insert("client_id".to_string(), client_id.clone());
         config.insert("tenant_id".to_string(), tenant_id.clone());
@@ -156,14 +204,18 @@ impl PyAzureCredential {
             credential_type: AzureCredentialType::ServicePrincipal,
             config,
             sensitive_config: Arc::new(sensitive_config),
-            token_cache: Arc::new(RwLock::new(None)),
-            refresh_mutex: Arc::new(Mutex::new(())),
+            token_cache,
+            refresh_mutex,
             client,
         })
     }
 
     #[staticmethod]
     pub fn managed_identity(client_id: Option<String>) -> PyResult<Self> {
+        let (token_cache, refresh_mutex) = shared_token_slot(TokenCacheKey::ManagedIdentity {
+            client_id: client_id.clone(),
+        });
+
         let mut config = HashMap::new();
         let mut sensitive_config = HashMap::new();
 
@@ -179,8 +231,8 @@ impl PyAzureCredential {
             credential_type: AzureCredentialType::ManagedIdentity,
             config,
             sensitive_config: Arc::new(sensitive_config),
-            token_cache: Arc::new(RwLock::new(None)),
-            refresh_mutex: Arc::new(Mutex::new(())),
+            token_cache,
+            refresh_mutex,
             client,
         })
     }
@@ -205,6 +257,8 @@ impl PyAzureCredential {
 
     #[staticmethod]
     pub fn default() -> PyResult<Self> {
+        let (token_cache, refresh_mutex) = shared_token_slot(TokenCacheKey::DefaultAzure);
+
         let client = build_http_client()
             .map_err(|e| PyRuntimeError::new_err(format!("Failed to build HTTP client: {}", e)))?;
 
@@ -212,8 +266,8 @@ impl PyAzureCredential {
             credential_type: AzureCredentialType::DefaultAzure,
             config: HashMap::new(),
             sensitive_config: Arc::new(HashMap::new()),
-            token_cache: Arc::new(RwLock::new(None)),
-            refresh_mutex: Arc::new(Mutex::new(())),
+            token_cache,
+            refresh_mutex,
             client,
         })
     }
@@ -349,10 +349,12 @@ pub fn bulk_insert<'p>(
 
     let col_count = columns.len();
 
-    // Hard limit for SQL Server is 2100. We use 2000 to be safe.
+    // Hard limit for SQL Server is 2100 parameters. We use 2000 to be safe.
+    // A VALUES table constructor is also capped at 1000 rows, which narrow
+    // tables (one or two columns) would otherwise exceed.
     // Calculate rows_per_batch here (sync, GIL-held phase) so chunking drives
     // conversion rather than being applied after a full allocation.
-    let rows_per_batch = (2000usize / col_count).max(1);
+    let rows_per_batch = (2000usize / col_count).clamp(1, 1000);
     let chunk_capacity = rows_per_batch * col_count;
 
     // Build owned chunks of at most `rows_per_batch` rows while still holding
@@ -1,9 +1,11 @@
+use bb8::ManageConnection;
+use futures_util::TryStreamExt;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyList;
 use pyo3_async_runtimes::tokio::future_into_py;
 use std::sync::Arc;
-use tiberius::{AuthMethod, Config, Row};
+use tiberius::{AuthMethod, Config, QueryItem, Row};
 use tokio::sync::RwLock;
 
 use crate::azure_auth::PyAzureCredential;
@@ -11,9 +13,12 @@ use crate::batch::{bulk_insert, execute_batch, query_batch};
 use crate::helpers::wrap_query_stream;
 use crate::parameter_conversion::{FastParameter, convert_parameters_to_fast, params_as_sql_refs};
 use crate::pool_config::PyPoolConfig;
-use crate::pool_manager::{ConnectionPool, ensure_pool_initialized_with_auth};
-use crate::ssl_config::PySslConfig;
-use crate::types::{create_connection_error, create_sql_error};
+use crate::pool_manager::{
+    AzureConnectionManager, ConnectionPool, ensure_pool_initialized_with_auth, warmup_pool,
+};
+use crate::ssl_config::{PySslConfig, apply_default_encryption};
+use crate::type_mapping::sql_to_python;
+use crate::types::{PyRowStream, RowSender, create_connection_error, create_sql_error};
 
 struct ConnectionHandles {
     pool: Arc<RwLock<Option<ConnectionPool>>>,
@@ -89,6 +94,66 @@ impl PyConnection {
         Ok(result)
     }
 
+    #[inline]
+    async fn execute_multi_result_query_async_gil_free(
+        pool: &ConnectionPool,
+        query: &str,
+        parameters: &[FastParameter],
+    ) -> PyResult<Vec<Vec<Row>>> {
+        let mut conn = Self::get_pool_connection(pool).await?;
+        let tiberius_params = params_as_sql_refs(parameters);
+
+        let stream = conn
+            .query(query, &tiberius_params)
+            .await
+            .map_err(|e| create_sql_error(e, "Query execution failed"))?;
+
+        let results = stream
+            .into_results()
+            .await
+            .map_err(|e| create_sql_error(e, "Failed to get results"))?;
+
+        drop(conn);
+        Ok(results)
+    }
+
+    async fn stream_rows_async_gil_free(
+        handles: &ConnectionHandles,
+        query: &str,
+        parameters: &[FastParameter],
+        sender: &RowSender,
+    ) -> PyResult<()> {
+        let pool = handles.ensure_connected().await?;
+        let mut conn = Self::get_pool_connection(&pool).await?;
+        let tiberius_params = params_as_sql_refs(parameters);
+
+        let mut stream = conn
+            .query(query, &tiberius_params)
+            .await
+            .map_err(|e| create_sql_error(e, "Query execution failed"))?;
+
+        while let Some(item) = stream
+            .try_next()
+            .await
+            .map_err(|e| create_sql_error(e, "Failed to read row"))?
+        {
+            match item {
+                QueryItem::Row(row) => {
+                    // A closed channel means the RowStream was dropped; stop
+                    // reading and let tiberius discard the rest on the next use
+                    if sender.send(Ok(row)).await.is_err() {
+                        break;
+                    }
+                }
+                // Only the first result set is streamed, as with query()
+                QueryItem::Metadata(meta) if meta.result_index() > 0 => break,
+                QueryItem::Metadata(_) => {}
+            }
+        }
+
+        Ok(())
+    }
+
     #[inline]
     async fn execute_simple_query_async_gil_free(
         pool: &ConnectionPool,
@@ -110,6 +175,40 @@ impl PyConnection {
         Ok(result)
     }
 
+    // Reads rows until the first one arrives, keeps it, and drains the rest of
+    // the response so the pooled connection goes back clean
+    #[inline]
+    async fn execute_scalar_async_gil_free(
+        pool: &ConnectionPool,
+        query: &str,
+        parameters: &[FastParameter],
+    ) -> PyResult<Option<Row>> {
+        let mut conn = Self::get_pool_connection(pool).await?;
+        let tiberius_params = params_as_sql_refs(parameters);
+
+        let mut stream = conn
+            .query(query, &tiberius_params)
+            .await
+            .map_err(|e| create_sql_error(e, "Query execution failed"))?;
+
+        let mut first_row = None;
+        while let Some(item) = stream
+            .try_next()
+            .await
+            .map_err(|e| create_sql_error(e, "Failed to get results"))?
+        {
+            if let QueryItem::Row(row) = item {
+                if first_row.is_none() {
+                    first_row = Some(row);
+                }
+            }
+        }
+
+        drop(stream);
+        drop(conn);
+        Ok(first_row)
+    }
+
     #[inline]
     async fn execute_command_async_gil_free(
         pool: &ConnectionPool,
@@ -150,8 +249,8 @@ impl PyConnection {
         instance_name: Option<String>,
         application_name: Option<String>,
     ) -> PyResult<Self> {
-        let config = if let Some(conn_str) = connection_string {
-            Config::from_ado_string(&conn_str)
+        let mut config = if let Some(ref conn_str) = connection_string {
+            Config::from_ado_string(conn_str)
                 .map_err(|e| PyValueError::new_err(format!("Invalid connection string: {}", e)))?
         } else if let Some(ref srv) = server {
             let mut config = Config::new();
@@ -201,6 +300,8 @@ impl PyConnection {
             ));
         };
 
+        apply_default_encryption(&mut config, connection_string.as_deref(), ssl_config.as_ref());
+
         if server.is_some() && username.is_none() && azure_credential.is_none() {
             return Err(PyValueError::new_err(
                 "Either username/password or azure_credential must be provided",
@@ -228,12 +329,122 @@ impl PyConnection {
 
         future_into_py(py, async move {
             let pool_ref = handles.ensure_connected().await?;
+            // Always sp_executesql, even without parameters: session state the
+            // text sets (#temp tables, SET options, USE) ends with the call
+            // instead of staying on the pooled connection for the next borrower
             let execution_result =
                 Self::execute_query_async_gil_free(&pool_ref, &query, &fast_parameters).await?;
             wrap_query_stream(execution_result)
         })
     }
 
+    // One-shot query on a dedicated connection that is closed afterwards.
+    // Never builds the pool (or its min_idle warmup), so a script that runs a
+    // single statement pays for one login only; repeated work belongs on the pool
+    #[pyo3(signature = (query, parameters=None))]
+    pub fn query_once<'p>(
+        &self,
+        py: Python<'p>,
+        query: String,
+        parameters: Option<&Bound<PyAny>>,
+    ) -> PyResult<Bound<'p, PyAny>> {
+        let fast_parameters = convert_parameters_to_fast(parameters, py)?;
+        let config = Arc::clone(&self.config);
+        let azure_credential = self.azure_credential.clone();
+        // Bound the whole connect (TCP, token, login) by the same budget a pooled
+        // checkout gets, so an unreachable host cannot leave the awaitable pending
+        let connect_timeout = self
+            .pool_config
+            .connection_timeout
+            .unwrap_or(std::time::Duration::from_secs(30));
+
+        future_into_py(py, async move {
+            // Same connect path as the pool (token refresh, routing redirects),
+            // just without a pool around it
+            let manager = AzureConnectionManager::new((*config).clone(), azure_credential);
+            let mut conn = tokio::time::timeout(connect_timeout, manager.connect())
+                .await
+                .map_err(|_| {
+                    create_connection_error(format!(
+                        "Timed out connecting to server after {:?}",
+                        connect_timeout
+                    ))
+                })??;
+
+            let tiberius_params = params_as_sql_refs(&fast_parameters);
+            let rows = conn
+                .query(query.as_str(), &tiberius_params)
+                .await
+                .map_err(|e| create_sql_error(e, "Query execution failed"))?
+                .into_first_result()
+                .await
+                .map_err(|e| create_sql_error(e, "Failed to get results"))?;
+
+            // Closes the socket; the server ends the session
+            drop(conn);
+            wrap_query_stream(rows)
+        })
+    }
+
+    // Streams the first result set row by row instead of buffering it. A task on
+    // the runtime holds one pooled connection and feeds a bounded channel, so the
+    // first row is usable as soon as it arrives. The connection stays checked out
+    // until the rows are exhausted or the returned RowStream is dropped
+    #[pyo3(signature = (query, parameters=None))]
+    pub fn query_iter(
+        &self,
+        py: Python<'_>,
+        query: String,
+        parameters: Option<&Bound<PyAny>>,
+    ) -> PyResult<PyRowStream> {
+        let fast_parameters = convert_parameters_to_fast(parameters, py)?;
+        let handles = self.clone_handles();
+        let (sender, stream) = PyRowStream::channel();
+
+        pyo3_async_runtimes::tokio::get_runtime().spawn(async move {
+            if let Err(e) =
+                Self::stream_rows_async_gil_free(&handles, &query, &fast_parameters, &sender).await
+            {
+                // The consumer sees the error on its next __anext__
+                let _ = sender.send(Err(e)).await;
+            }
+        });
+
+        Ok(stream)
+    }
+
+    // Runs a multi-statement batch in one round trip and returns one
+    // QueryStream per result set, in the order the server produced them
+    #[pyo3(signature = (query, parameters=None))]
+    pub fn query_results<'p>(
+        &self,
+        py: Python<'p>,
+        query: String,
+        parameters: Option<&Bound<PyAny>>,
+    ) -> PyResult<Bound<'p, PyAny>> {
+        let fast_parameters = convert_parameters_to_fast(parameters, py)?;
+        let handles = self.clone_handles();
+
+        future_into_py(py, async move {
+            let pool_ref = handles.ensure_connected().await?;
+            let result_sets = Self::execute_multi_result_query_async_gil_free(
+                &pool_ref,
+                &query,
+                &fast_parameters,
+            )
+            .await?;
+
+            Python::attach(|py| -> PyResult<Py<PyAny>> {
+                let mut py_results = Vec::with_capacity(result_sets.len());
+                for rows in result_sets {
+                    let query_stream = crate::types::PyQueryStream::from_tiberius_rows(rows, py)?;
+                    py_results.push(Py::new(py, query_stream)?.into_any());
+                }
+                Ok(PyList::new(py, py_results)?.into_any().unbind())
+            })
+        })
+    }
+
     #[pyo3(signature = (query))]
     pub fn simple_query<'p>(&self, py: Python<'p>, query: String) -> PyResult<Bound<'p, PyAny>> {
         let handles = self.clone_handles();
@@ -264,6 +475,61 @@ impl PyConnection {
         })
     }
 
+    // Returns the first column of the first row, or None when there are no rows.
+    // Only that one cell is converted to Python: no QueryStream, FastRow or
+    // column metadata is built, which suits COUNT(*)/MAX()-style probes
+    #[pyo3(signature = (query, parameters=None))]
+    pub fn execute_scalar<'p>(
+        &self,
+        py: Python<'p>,
+        query: String,
+        parameters: Option<&Bound<PyAny>>,
+    ) -> PyResult<Bound<'p, PyAny>> {
+        let fast_parameters = convert_parameters_to_fast(parameters, py)?;
+        let handles = self.clone_handles();
+
+        future_into_py(py, async move {
+            let pool_ref = handles.ensure_connected().await?;
+            let first_row =
+                Self::execute_scalar_async_gil_free(&pool_ref, &query, &fast_parameters).await?;
+
+            Python::attach(|py| -> PyResult<Py<PyAny>> {
+                match first_row {
+                    Some(row) if !row.columns().is_empty() => {
+                        let col_type = row.columns()[0].column_type();
+                        sql_to_python(&row, 0, col_type, py)
+                    }
+                    _ => Ok(py.None()),
+                }
+            })
+        })
+    }
+
+    // Runs a multi-statement script as one plain SQL batch rather than inside
+    // sp_executesql, so objects it creates (e.g. #temp tables) outlive the call,
+    // but only on the one pooled session that ran it: later calls may be handed a
+    // different connection and not see them. Every result is drained so an error
+    // in any statement is raised
+    pub fn execute_script<'p>(
+        &self,
+        py: Python<'p>,
+        script: String,
+    ) -> PyResult<Bound<'p, PyAny>> {
+        let handles = self.clone_handles();
+
+        future_into_py(py, async move {
+            let pool_ref = handles.ensure_connected().await?;
+            let mut conn = Self::get_pool_connection(&pool_ref).await?;
+            conn.simple_query(script)
+                .await
+                .map_err(|e| create_sql_error(e, "Script execution failed"))?
+                .into_results()
+                .await
+                .map_err(|e| create_sql_error(e, "Script execution failed"))?;
+            Ok(())
+        })
+    }
+
     pub fn is_connected<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyAny>> {
         let pool = self.pool.clone();
         future_into_py(py, async move {
@@ -278,13 +544,19 @@ impl PyConnection {
         let min_idle = self.pool_config.min_idle;
 
         future_into_py(py, async move {
-            let (is_connected, connections, idle_connections) = {
+            let (is_connected, connections, idle_connections, closed_idle, closed_lifetime) = {
                 let pool_guard = pool.read().await;
                 if let Some(pool_ref) = pool_guard.as_ref() {
                     let state = pool_ref.state();
-                    (true, state.connections, state.idle_connections)
+                    (
+                        true,
+                        state.connections,
+                        state.idle_connections,
+                        state.statistics.connections_closed_idle_timeout,
+                        state.statistics.connections_closed_max_lifetime,
+                    )
                 } else {
-                    (false, 0u32, 0u32)
+                    (false, 0u32, 0u32, 0u64, 0u64)
                 }
             };
 
@@ -299,6 +571,8 @@ impl PyConnection {
                 )?;
                 dict.set_item("max_size", max_size)?;
                 dict.set_item("min_idle", min_idle)?;
+                dict.set_item("closed_idle_timeout", closed_idle)?;
+                dict.set_item("closed_max_lifetime", closed_lifetime)?;
                 Ok(dict.unbind())
             })
             .ok_or_else(|| {
@@ -307,6 +581,69 @@ impl PyConnection {
         })
     }
 
+    // Connecting already warms `min_idle` connections; warm() tops the pool up
+    // (default: max_size) ahead of a burst so early requests don't queue on handshakes.
+    #[pyo3(signature = (connections = None))]
+    pub fn warm<'p>(&self, py: Python<'p>, connections: Option<u32>) -> PyResult<Bound<'p, PyAny>> {
+        let handles = self.clone_handles();
+        let max_size = handles.pool_config.max_size;
+        let target = connections.unwrap_or(max_size).min(max_size);
+        let conn_timeout = handles
+            .pool_config
+            .connection_timeout
+            .unwrap_or(std::time::Duration::from_secs(30));
+
+        future_into_py(py, async move {
+            let pool = handles.ensure_connected().await?;
+            warmup_pool(&pool, target, conn_timeout).await?;
+            Ok(pool.state().connections)
+        })
+    }
+
+    // bb8 has no eviction callback, so poll its reaper counters on the runtime
+    // instead of making Python sleep through a worst-case idle timeout.
+    // Resolves with the number of idle/lifetime evictions seen, or 0 on timeout.
+    #[pyo3(signature = (timeout_secs = 60.0))]
+    pub fn wait_for_eviction<'p>(
+        &self,
+        py: Python<'p>,
+        timeout_secs: f64,
+    ) -> PyResult<Bound<'p, PyAny>> {
+        if !timeout_secs.is_finite() || timeout_secs < 0.0 {
+            return Err(PyValueError::new_err(
+                "timeout_secs must be a non-negative number",
+            ));
+        }
+        let pool = Arc::clone(&self.pool);
+
+        future_into_py(py, async move {
+            let pool = pool
+                .read()
+                .await
+                .clone()
+                .ok_or_else(|| create_connection_error("Connection is not established"))?;
+            let evicted = |pool: &ConnectionPool| {
+                let stats = pool.state().statistics;
+                stats.connections_closed_idle_timeout + stats.connections_closed_max_lifetime
+            };
+
+            let baseline = evicted(&pool);
+            let deadline =
+                tokio::time::Instant::now() + std::time::Duration::from_secs_f64(timeout_secs);
+            let mut ticker = tokio::time::interval(std::time::Duration::from_millis(50));
+            loop {
+                ticker.tick().await;
+                let current = evicted(&pool);
+                if current > baseline {
+                    return Ok(current - baseline);
+                }
+                if tokio::time::Instant::now() >= deadline {
+                    return Ok(0);
+                }
+            }
+        })
+    }
+
     pub fn __aenter__<'p>(slf: Bound<'p, Self>, py: Python<'p>) -> PyResult<Bound<'p, PyAny>> {
         let handles = slf.borrow().clone_handles();
         let slf_clone = slf.clone().unbind();
@@ -21,10 +21,10 @@ mod types;
 pub use azure_auth::{AzureCredentialType, PyAzureCredential};
 pub use connection::PyConnection;
 pub use pool_config::PyPoolConfig;
-pub use py_parameters::{Parameter, Parameters};
+pub use py_parameters::{FrozenParameters, Parameter, Parameters};
 pub use ssl_config::{EncryptionLevel, PySslConfig};
 pub use transaction::Transaction;
-pub use types::{PyFastRow, PyQueryStream, SqlError, SqlConnectionError, TlsError, ProtocolError, ConversionError};
+pub use types::{PyFastRow, PyQueryStream, PyRowStream, SqlError, SqlConnectionError, TlsError, ProtocolError, ConversionError};
 
 use crate::parameter_conversion::TypedNull;
 
@@ -65,8 +65,10 @@ fn fastmssql(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<Transaction>()?;
     m.add_class::<PyFastRow>()?;
     m.add_class::<PyQueryStream>()?;
+    m.add_class::<PyRowStream>()?;
     m.add_class::<Parameter>()?;
     m.add_class::<Parameters>()?;
+    m.add_class::<FrozenParameters>()?;
     m.add_class::<PyPoolConfig>()?;
     m.add_class::<PySslConfig>()?;
     m.add_class::<EncryptionLevel>()?;
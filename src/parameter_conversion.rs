@@ -1,4 +1,4 @@
-use crate::py_parameters::Parameters;
+use crate::py_parameters::{FrozenParameters, Parameters};
 use crate::type_mapping;
 use chrono::{NaiveDate, NaiveDateTime};
 use pyo3::exceptions::PyValueError;
@@ -103,20 +103,28 @@ pub fn convert_parameters_to_fast(
     py: Python,
 ) -> PyResult<SmallVec<[FastParameter; 16]>> {
     if let Some(params) = parameters {
-        if let Ok(params_obj) = params.extract::<Py<Parameters>>() {
-            let list = params_obj.bind(py).call_method0("to_list")?;
-            python_params_to_fast_parameters(list.cast::<PyList>()?)
+        if let Ok(frozen) = params.cast::<FrozenParameters>() {
+            // Already validated and converted by `Parameters.freeze()`
+            Ok(frozen.get().values.iter().cloned().collect())
+        } else if let Ok(params_obj) = params.cast::<Parameters>() {
+            // Borrow the Rust struct directly instead of dispatching `to_list`
+            // through Python attribute lookup, so a `Parameters` object reused
+            // across calls costs no more than a plain list.
+            let list = params_obj.borrow().to_list(py)?;
+            python_params_to_fast_parameters(list.bind(py))
         } else if let Ok(list) = params.cast::<PyList>() {
             python_params_to_fast_parameters(list)
         } else {
-            Err(PyValueError::new_err("Must be list or Parameters object"))
+            Err(PyValueError::new_err(
+                "Must be list, Parameters or FrozenParameters object",
+            ))
         }
     } else {
         Ok(SmallVec::new())
     }
 }
 
-fn python_params_to_fast_parameters(
+pub(crate) fn python_params_to_fast_parameters(
     params: &Bound<PyList>,
 ) -> PyResult<SmallVec<[FastParameter; 16]>> {
     let len = params.len();
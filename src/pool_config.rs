@@ -213,13 +213,16 @@ impl PyPoolConfig {
     }
 
     /// Create a default configuration for low-resource scenarios
+    /// Small pools with one warm connection: bb8 never reaps below min_idle, so a
+    /// short idle timeout only closes burst connections, and a 30 min lifetime
+    /// recycles sockets before typical NAT/firewall idle cutoffs drop them
     #[staticmethod]
     pub fn low_resource() -> Self {
         PyPoolConfig {
             max_size: 3,
             min_idle: Some(1),
-            max_lifetime: Some(std::time::Duration::from_secs(900)),
-            idle_timeout: Some(std::time::Duration::from_secs(300)),
+            max_lifetime: Some(std::time::Duration::from_secs(1800)),
+            idle_timeout: Some(std::time::Duration::from_secs(60)),
             connection_timeout: Some(std::time::Duration::from_secs(15)),
             test_on_check_out: None,
             retry_connection: None,
@@ -227,13 +230,14 @@ impl PyPoolConfig {
     }
 
     /// Create a default configuration for development scenarios
+    /// Same idle/lifetime policy as low_resource, with a little more headroom
     #[staticmethod]
     pub fn development() -> Self {
         PyPoolConfig {
             max_size: 5,
             min_idle: Some(1),
-            max_lifetime: Some(std::time::Duration::from_secs(600)),
-            idle_timeout: Some(std::time::Duration::from_secs(180)),
+            max_lifetime: Some(std::time::Duration::from_secs(1800)),
+            idle_timeout: Some(std::time::Duration::from_secs(60)),
             connection_timeout: Some(std::time::Duration::from_secs(10)),
             test_on_check_out: None,
             retry_connection: None,
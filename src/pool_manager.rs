@@ -226,11 +226,18 @@ pub async fn ensure_pool_initialized_with_auth(
     Ok(new_pool)
 }
 
-/// Warms up the connection pool by pre-establishing `target_connections` connections.
-/// This eliminates cold-start latency on first queries.
+/// Warms up the connection pool until it holds `target_connections` connections
+/// (callers cap this at `max_size`). This eliminates cold-start latency on first queries.
 ///
-/// All tasks run concurrently via a [`tokio::task::JoinSet`].  The total budget is
-/// `connection_timeout × target_connections` (capped at 120 s).  If the deadline
+/// Only the shortfall against the pool's current connection count is opened, so
+/// connections already open (idle or checked out by other tasks) count toward the
+/// target. The tasks run concurrently via a [`tokio::task::JoinSet`], so the TCP,
+/// TLS and login handshakes overlap and warmup costs roughly one connect instead
+/// of N. A task keeps its guard (so later tasks open new connections instead of
+/// reusing it) until the pool reaches the target, then hands it straight back;
+/// warmup therefore never holds more guards than the shortfall and never waits on
+/// connections other tasks have checked out.  The total budget is
+/// `connection_timeout × shortfall` (capped at 120 s).  If the deadline
 /// expires, all outstanding tasks are cancelled via [`JoinSet::shutdown`] and an
 /// error is returned.  All individual errors are collected and surfaced together
 /// rather than bailing on the first failure.
@@ -241,30 +248,58 @@ pub async fn warmup_pool(
 ) -> PyResult<()> {
     use tokio::task::JoinSet;
 
-    // Total warmup budget: per-connection timeout × number of connections, capped at
+    let target = target_connections;
+    let shortfall = target.saturating_sub(pool.state().connections);
+    if shortfall == 0 {
+        return Ok(());
+    }
+
+    // Total warmup budget: per-connection timeout × connections to open, capped at
     // 2 minutes.  bb8 will enforce connection_timeout per task when calling
     // pool.get(); this outer deadline is a safety net to guarantee that
     // warmup_pool() always returns even if bb8's own timeout is misconfigured or
     // bypassed.
     let warmup_budget =
-        (connection_timeout * target_connections.max(1)).min(std::time::Duration::from_secs(120));
+        (connection_timeout * shortfall).min(std::time::Duration::from_secs(120));
 
-    let mut set: JoinSet<Result<(), bb8::RunError<PoolConnectionError>>> = JoinSet::new();
+    let mut set: JoinSet<
+        Result<
+            Option<bb8::PooledConnection<'static, AzureConnectionManager>>,
+            bb8::RunError<PoolConnectionError>,
+        >,
+    > = JoinSet::new();
 
-    for _ in 0..target_connections {
+    for _ in 0..shortfall {
         let pool_clone = pool.clone();
-        // Each task acquires one connection (exercising the full connect path) then
-        // immediately drops the guard, returning it to the pool.
-        set.spawn(async move { pool_clone.get().await.map(|_conn| ()) });
+        // Each task acquires one connection (exercising the full connect path) and
+        // hands the owned guard back so it stays checked out while the pool is
+        // still short; once the target is reached the guard is released at once
+        // so any task still waiting in get_owned() is served by it.
+        set.spawn(async move {
+            let conn = pool_clone.get_owned().await?;
+            if pool_clone.state().connections >= target {
+                return Ok(None);
+            }
+            Ok(Some(conn))
+        });
     }
 
     let deadline = tokio::time::Instant::now() + warmup_budget;
     let mut errors: Vec<String> = Vec::new();
+    let mut warmed = Vec::with_capacity(shortfall as usize);
 
     loop {
         match tokio::time::timeout_at(deadline, set.join_next()).await {
-            // Task completed successfully.
-            Ok(Some(Ok(Ok(())))) => {}
+            // Target reached – hand every held guard back so waiters are served.
+            Ok(Some(Ok(Ok(None)))) => warmed.clear(),
+            // Pool still short – keep the guard so the next task opens a new one.
+            Ok(Some(Ok(Ok(Some(conn))))) => {
+                if pool.state().connections >= target {
+                    warmed.clear();
+                } else {
+                    warmed.push(conn);
+                }
+            }
             // Task returned a bb8/connection error – collect it and continue.
             Ok(Some(Ok(Err(e)))) => errors.push(e.to_string()),
             // Task panicked or was cancelled – record the join error and continue.
@@ -283,6 +318,9 @@ pub async fn warmup_pool(
         }
     }
 
+    // Return every warmed connection to the pool as idle.
+    drop(warmed);
+
     if !errors.is_empty() {
         return Err(create_connection_error(format!(
             "Connection pool warmup encountered {} error(s): {}",
@@ -1,6 +1,8 @@
+use crate::parameter_conversion::{FastParameter, python_params_to_fast_parameters};
 use crate::type_mapping;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList, PyTuple};
+use std::sync::Arc;
 
 #[pyclass]
 pub struct Parameter {
@@ -161,6 +163,32 @@ impl Parameters {
         Ok(PyList::new(py, values)?.into())
     }
 
+    /// Convert and validate the values once, for reuse across many executions
+    pub fn freeze(&self, py: Python) -> PyResult<FrozenParameters> {
+        let list = self.to_list(py)?;
+        let values = python_params_to_fast_parameters(list.bind(py))?;
+        Ok(FrozenParameters {
+            values: values.into_iter().collect(),
+        })
+    }
+
+    /// Replace the value of a positional parameter in place, keeping its SQL type
+    /// Lets a loop reuse one collection instead of building a new one per call
+    fn __setitem__(&mut self, py: Python, index: isize, value: Py<PyAny>) -> PyResult<()> {
+        let len = self.positional.len() as isize;
+        let actual_index = if index < 0 { len + index } else { index };
+        if actual_index < 0 || actual_index >= len {
+            return Err(pyo3::exceptions::PyIndexError::new_err(
+                "Parameter index out of range",
+            ));
+        }
+
+        let slot = &mut self.positional[actual_index as usize];
+        let sql_type = slot.borrow(py).sql_type.clone();
+        *slot = Py::new(py, Parameter::new(value, sql_type))?;
+        Ok(())
+    }
+
     fn __len__(&self, py: Python) -> usize {
         let named_len = self.named.bind(py).len();
         self.positional.len() + named_len
@@ -201,3 +229,23 @@ impl Parameters {
         Ok(new_dict.into())
     }
 }
+
+/// Immutable snapshot of a `Parameters` collection, already expanded and
+/// converted to wire values. Passing it to `query`/`execute` skips the
+/// per-call walk over Python objects, so it pays off when the same values
+/// are sent many times.
+#[pyclass(frozen)]
+pub struct FrozenParameters {
+    pub(crate) values: Arc<[FastParameter]>,
+}
+
+#[pymethods]
+impl FrozenParameters {
+    fn __len__(&self) -> usize {
+        self.values.len()
+    }
+
+    fn __repr__(&self) -> String {
+        format!("FrozenParameters(positional={})", self.values.len())
+    }
+}
@@ -230,4 +230,112 @@ impl PySslConfig {
             config.trust_cert_ca(ca_path.to_string_lossy().to_string());
         }
     }
-}
\ No newline at end of file
+}
+
+/// Encrypt only the login on a loopback server unless the caller chose a level,
+/// either with an SslConfig or with `Encrypt=` in the connection string.
+/// Shared by the Connection and Transaction constructors.
+pub fn apply_default_encryption(
+    config: &mut tiberius::Config,
+    connection_string: Option<&str>,
+    ssl_config: Option<&PySslConfig>,
+) {
+    let chosen =
+        ssl_config.is_some() || connection_string.is_some_and(connection_string_sets_encryption);
+    if !chosen {
+        apply_loopback_default(config);
+    }
+}
+
+/// Whether an ADO.NET connection string sets `Encrypt` itself
+fn connection_string_sets_encryption(conn_str: &str) -> bool {
+    conn_str
+        .split(';')
+        .filter_map(|part| part.split_once('='))
+        .any(|(key, _)| key.trim().eq_ignore_ascii_case("encrypt"))
+}
+
+/// Whether a `host:port` address (as returned by `Config::get_addr`) names this
+/// machine: localhost, (local), ".", or any address in 127.0.0.0/8 or ::1
+fn is_loopback_addr(addr: &str) -> bool {
+    let host = match addr.strip_prefix('[') {
+        // Bracketed IPv6: [::1]:1433
+        Some(rest) => rest.split(']').next().unwrap_or(rest),
+        None => addr.rsplit_once(':').map_or(addr, |(host, _)| host),
+    };
+
+    host.eq_ignore_ascii_case("localhost")
+        || host == "(local)"
+        || host == "."
+        || host
+            .parse::<std::net::IpAddr>()
+            .is_ok_and(|ip| ip.is_loopback())
+}
+
+/// Encrypt only the login when the server is on this machine; returns whether
+/// the level was changed. That traffic never leaves the host, so encrypting
+/// every packet costs CPU without protecting anything; the login packet (and
+/// its password) is still sent over TLS. A port forward or SSH tunnel also
+/// looks local, so callers reaching a remote server that way should pass an
+/// explicit SslConfig.
+fn apply_loopback_default(config: &mut tiberius::Config) -> bool {
+    let is_loopback = is_loopback_addr(&config.get_addr());
+    if is_loopback {
+        config.encryption(tiberius::EncryptionLevel::Off);
+    }
+    is_loopback
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use tiberius::Config;
+
+    fn config_for_host(host: &str) -> Config {
+        let mut config = Config::new();
+        config.host(host);
+        config.port(1433);
+        config
+    }
+
+    #[test]
+    fn connection_string_encrypt_key_is_detected() {
+        assert!(connection_string_sets_encryption(
+            "Server=db;Encrypt=true;User Id=sa"
+        ));
+        assert!(connection_string_sets_encryption(
+            "Server=db; encrypt = no;User Id=sa"
+        ));
+        assert!(!connection_string_sets_encryption(
+            "Server=db;Database=app;User Id=sa;Password=x"
+        ));
+    }
+
+    #[test]
+    fn loopback_hosts_get_login_only_encryption() {
+        let mut config =
+            Config::from_ado_string("Server=tcp:localhost,1433;User Id=sa;Password=x").unwrap();
+        assert!(apply_loopback_default(&mut config));
+
+        for host in ["::1", "127.0.0.1", "127.0.0.2", "(local)", "."] {
+            assert!(
+                apply_loopback_default(&mut config_for_host(host)),
+                "{host} should be treated as loopback"
+            );
+        }
+
+        assert!(is_loopback_addr("[::1]:1433"));
+        assert!(is_loopback_addr("localhost:1433"));
+    }
+
+    #[test]
+    fn remote_hosts_keep_default_encryption() {
+        for host in ["db.example.com", "10.0.0.5", "128.0.0.1", "2001:db8::1"] {
+            assert!(
+                !apply_loopback_default(&mut config_for_host(host)),
+                "{host} should not be treated as loopback"
+            );
+        }
+        assert!(!is_loopback_addr("[2001:db8::1]:1433"));
+    }
+}
@@ -12,7 +12,7 @@ use crate::azure_auth::PyAzureCredential;
 use crate::batch::{execute_batch_on_connection, parse_batch_items, query_batch_on_connection};
 use crate::helpers::wrap_query_stream;
 use crate::parameter_conversion::{convert_parameters_to_fast, params_as_sql_refs};
-use crate::ssl_config::PySslConfig;
+use crate::ssl_config::{PySslConfig, apply_default_encryption};
 use crate::types::{create_connection_error, create_sql_error};
 
 /// Type for a single direct connection (not pooled)
@@ -62,8 +62,8 @@ impl Transaction {
         // Store the original server parameter for validation before it gets reassigned
         let server_param = server.clone();
 
-        let config = if let Some(conn_str) = connection_string {
-            Config::from_ado_string(&conn_str)
+        let mut config = if let Some(ref conn_str) = connection_string {
+            Config::from_ado_string(conn_str)
                 .map_err(|e| PyValueError::new_err(format!("Invalid connection string: {}", e)))?
         } else if let Some(srv) = server {
             let mut config = Config::new();
@@ -116,6 +116,8 @@ impl Transaction {
             ));
         };
 
+        apply_default_encryption(&mut config, connection_string.as_deref(), ssl_config.as_ref());
+
         // Validate authentication configuration when using individual parameters
         if server_param.is_some() && username.is_none() && azure_credential.is_none() {
             return Err(PyValueError::new_err(
@@ -2,10 +2,11 @@ use crate::type_mapping;
 use ahash::AHashMap as HashMap;
 use pyo3::exceptions::{PyException, PyRuntimeError};
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyList, PyString};
 use pyo3::{create_exception, exceptions::PyValueError};
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use tiberius::{ColumnType, Row, error::Error as TError};
+use tokio::sync::{Mutex, mpsc};
 
 create_exception!(crate::fastmssql, SqlError, PyException);
 create_exception!(crate::fastmssql, SqlConnectionError, PyException);
@@ -102,72 +103,87 @@ pub struct ColumnInfo {
     pub map: HashMap<String, usize>,
     /// Cached column types (one per column) to avoid repeated lookups during value conversion
     pub column_types: Vec<ColumnType>,
+    /// Interned Python column names, created on first use and shared by every row
+    py_names: OnceLock<Vec<Py<PyString>>>,
+}
+
+impl ColumnInfo {
+    /// Python column names in order; built once per result set, not once per row
+    pub fn py_names(&self, py: Python) -> &[Py<PyString>] {
+        self.py_names.get_or_init(|| {
+            self.names
+                .iter()
+                .map(|name| PyString::intern(py, name).unbind())
+                .collect()
+        })
+    }
+
+    /// Column names as a new Python list that reuses the interned strings
+    pub fn py_names_list<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        PyList::new(py, self.py_names(py).iter().map(|name| name.bind(py)))
+    }
 }
 
 /// Memory-optimized to share column metadata across all rows in a result set.
+/// Cells are decoded lazily: a value is converted to Python the first time it is
+/// read and cached, so columns that are never accessed are never converted.
 #[pyclass(name = "FastRow", from_py_object)]
+#[derive(Clone)]
 pub struct PyFastRow {
-    // Row values stored in column order for cache-friendly access
-    values: Vec<Py<PyAny>>,
+    // Raw Tiberius row, shared so clones never copy cell data
+    row: Arc<Row>,
+    // Converted values in column order, filled on first access and shared by clones
+    cells: Arc<[OnceLock<Py<PyAny>>]>,
     // Shared pointer to column metadata for the entire result set
     column_info: Arc<ColumnInfo>,
 }
 
-impl Clone for PyFastRow {
-    fn clone(&self) -> Self {
-        Python::attach(|py| PyFastRow {
-            values: self.values.iter().map(|v| v.clone_ref(py)).collect(),
-            column_info: Arc::clone(&self.column_info),
-        })
-    }
-}
-
 impl PyFastRow {
     /// Create a new PyFastRow from a Tiberius row and shared column info
-    pub fn from_tiberius_row(row: Row, py: Python, column_info: Arc<ColumnInfo>) -> PyResult<Self> {
-        // Pre-allocate vector with exact capacity and cache num_columns to avoid repeated lookups
-        let num_columns = column_info.names.len();
-        let mut values = Vec::with_capacity(num_columns);
-
-        // Eagerly convert all values in column order using cached column types
-        for i in 0..num_columns {
-            let col_type = column_info
-                .column_types
-                .get(i)
-                .copied()
-                .ok_or_else(|| PyValueError::new_err("Column type not found"))?;
-            let value = Self::extract_value_direct(&row, i, col_type, py)?;
-            values.push(value);
-        }
-
-        Ok(PyFastRow {
-            values,
+    /// No values are converted here; see `value_at`
+    pub fn from_tiberius_row(row: Row, column_info: Arc<ColumnInfo>) -> Self {
+        let cells = (0..column_info.names.len()).map(|_| OnceLock::new()).collect();
+        PyFastRow {
+            row: Arc::new(row),
+            cells,
             column_info,
-        })
+        }
     }
 
-    /// Convert value directly from Tiberius to Python using centralized type mapping
-    /// Uses cached column type to avoid repeated lookups
+    /// Return the Python value of one cell, converting and caching it on first use
     #[inline]
-    fn extract_value_direct(
-        row: &Row,
-        index: usize,
-        col_type: ColumnType,
-        py: Python,
-    ) -> PyResult<Py<PyAny>> {
-        type_mapping::sql_to_python(row, index, col_type, py)
+    fn value_at(&self, py: Python, index: usize) -> PyResult<Py<PyAny>> {
+        let cell = &self.cells[index];
+        if let Some(value) = cell.get() {
+            return Ok(value.clone_ref(py));
+        }
+        let col_type = self
+            .column_info
+            .column_types
+            .get(index)
+            .copied()
+            .ok_or_else(|| PyValueError::new_err("Column type not found"))?;
+        let value = type_mapping::sql_to_python(&self.row, index, col_type, py)?;
+        // Another reader may have filled the cell first; either value is equivalent
+        let _ = cell.set(value);
+        Ok(cell.get().expect("cell initialised above").clone_ref(py))
+    }
+
+    /// Convert every cell, in column order
+    fn all_values(&self, py: Python) -> PyResult<Vec<Py<PyAny>>> {
+        (0..self.cells.len()).map(|i| self.value_at(py, i)).collect()
     }
 }
 
 #[pymethods]
 impl PyFastRow {
-    /// Ultra-fast column access using shared column map and direct Vec indexing
+    /// Ultra-fast column access using shared column map; converts only this cell
     pub fn __getitem__(&self, py: Python, key: Bound<PyAny>) -> PyResult<Py<PyAny>> {
         // Try string extraction first (most common case)
         if let Ok(name) = key.extract::<&str>() {
-            // Access by name: O(1) hash lookup + O(1) Vec access
+            // Access by name: O(1) hash lookup + O(1) cell access
             if let Some(&index) = self.column_info.map.get(name) {
-                Ok(self.values[index].clone_ref(py))
+                self.value_at(py, index)
             } else {
                 Err(PyValueError::new_err(format!(
                     "Column '{}' not found",
@@ -175,25 +191,43 @@ impl PyFastRow {
                 )))
             }
         } else if let Ok(index) = key.extract::<isize>() {
-            // Access by index: Direct O(1) Vec access - extremely fast!
+            // Access by index: direct O(1) cell access
             // Normalise negative indices the same way Python sequences do.
-            let len = self.values.len() as isize;
+            let len = self.cells.len() as isize;
             let actual = if index < 0 { len + index } else { index };
             if actual < 0 || actual >= len {
                 Err(pyo3::exceptions::PyIndexError::new_err(
                     "Column index out of range",
                 ))
             } else {
-                Ok(self.values[actual as usize].clone_ref(py))
+                self.value_at(py, actual as usize)
             }
         } else {
             Err(PyValueError::new_err("Key must be string or integer"))
         }
     }
 
-    /// Get all column names from shared column info - returns slice to avoid cloning
-    pub fn columns(&self) -> &[String] {
-        &self.column_info.names
+    /// Get all column names, reusing the result set's interned name strings
+    pub fn columns<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        self.column_info.py_names_list(py)
+    }
+
+    /// Column names, so dict(row) builds {name: value} through the mapping protocol
+    pub fn keys<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        self.column_info.py_names_list(py)
+    }
+
+    /// Attribute access to columns: row.name is row["name"]
+    /// Only called when normal lookup fails, so methods such as get() or
+    /// values() win over columns of the same name; use row["get"] for those
+    pub fn __getattr__(&self, py: Python, name: &str) -> PyResult<Py<PyAny>> {
+        match self.column_info.map.get(name) {
+            Some(&index) => self.value_at(py, index),
+            None => Err(pyo3::exceptions::PyAttributeError::new_err(format!(
+                "'FastRow' object has no attribute '{}'",
+                name
+            ))),
+        }
     }
 
     /// Get number of columns
@@ -211,30 +245,37 @@ impl PyFastRow {
         self.__getitem__(py, index.into_pyobject(py)?.into_any())
     }
 
-    /// Get all values as a list - optimized to minimize cloning
+    /// Get all values as a list
     pub fn values(&self, py: Python) -> PyResult<Py<pyo3::types::PyList>> {
-        Ok(pyo3::types::PyList::new(py, &self.values)?.into())
+        Ok(pyo3::types::PyList::new(py, self.all_values(py)?)?.into())
     }
 
-    /// Convert to dictionary - optimized with zip iterator
+    /// Convert to dictionary, keyed by the shared interned column names so no
+    /// key string is allocated or re-hashed per row
     pub fn to_dict(&self, py: Python) -> PyResult<Py<PyAny>> {
         let dict = PyDict::new(py);
 
-        for (name, value) in self.column_info.names.iter().zip(self.values.iter()) {
-            dict.set_item(name, value)?;
+        for (index, name) in self.column_info.py_names(py).iter().enumerate() {
+            dict.set_item(name.bind(py), self.value_at(py, index)?)?;
         }
 
         Ok(dict.into())
     }
 
-    /// String representation
-    pub fn __str__(&self) -> String {
-        format!("FastRow with {} columns", self.column_info.names.len())
-    }
-
-    /// Detailed representation
-    pub fn __repr__(&self) -> String {
-        format!("FastRow(columns={:?})", self.column_info.names)
+    /// Printable representation, namedtuple style: FastRow(id=1, name='a')
+    /// Column names come from the shared column info, so no dict is built
+    pub fn __repr__(&self, py: Python) -> PyResult<String> {
+        let mut out = String::from("FastRow(");
+        for (index, name) in self.column_info.names.iter().enumerate() {
+            if index > 0 {
+                out.push_str(", ");
+            }
+            out.push_str(name);
+            out.push('=');
+            out.push_str(self.value_at(py, index)?.bind(py).repr()?.to_str()?);
+        }
+        out.push(')');
+        Ok(out)
     }
 }
 
@@ -260,9 +301,119 @@ fn build_column_info(first_row: &Row) -> Arc<ColumnInfo> {
         names,
         map,
         column_types,
+        py_names: OnceLock::new(),
     })
 }
 
+/// Awaitable that completes immediately with an already available value
+/// Used by QueryStream.__anext__ so async iteration over buffered rows costs
+/// no more than synchronous iteration
+#[pyclass(name = "_ReadyAwaitable")]
+struct ReadyAwaitable {
+    value: Option<Py<PyAny>>,
+}
+
+#[pymethods]
+impl ReadyAwaitable {
+    fn __await__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    /// Finish the await on the first step, handing back the value via StopIteration
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let value = self.value.take().unwrap_or_else(|| py.None());
+        Err(pyo3::exceptions::PyStopIteration::new_err((value,)))
+    }
+}
+
+/// Rows the producer task may run ahead of the Python consumer
+const ROW_STREAM_CAPACITY: usize = 256;
+
+/// Sending half of a RowStream, fed by the task that owns the pooled connection
+pub type RowSender = mpsc::Sender<PyResult<Row>>;
+
+/// Async iterator over rows as they arrive from the server
+/// Unlike QueryStream, rows are not buffered up front: a producer task reads the
+/// TDS stream into a bounded channel, so memory is capped at ROW_STREAM_CAPACITY
+/// rows and the first row is available before the result set has finished
+#[pyclass(name = "RowStream")]
+pub struct PyRowStream {
+    receiver: Arc<Mutex<mpsc::Receiver<PyResult<Row>>>>,
+    column_info: Arc<OnceLock<Arc<ColumnInfo>>>,
+}
+
+impl PyRowStream {
+    /// Create an empty stream and the sender its producer task writes to
+    pub fn channel() -> (RowSender, Self) {
+        let (sender, receiver) = mpsc::channel(ROW_STREAM_CAPACITY);
+        let stream = PyRowStream {
+            receiver: Arc::new(Mutex::new(receiver)),
+            column_info: Arc::new(OnceLock::new()),
+        };
+        (sender, stream)
+    }
+
+    /// Wrap a received row, building the shared column info from the first one
+    fn wrap_row(
+        item: PyResult<Row>,
+        column_info: &OnceLock<Arc<ColumnInfo>>,
+    ) -> PyResult<PyFastRow> {
+        let row = item?;
+        let info = Arc::clone(column_info.get_or_init(|| build_column_info(&row)));
+        Ok(PyFastRow::from_tiberius_row(row, info))
+    }
+}
+
+#[pymethods]
+impl PyRowStream {
+    /// Return self for asynchronous iteration protocol (async for row in stream:)
+    pub fn __aiter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    /// Get the next row, waiting for the server only when none is buffered
+    pub fn __anext__<'p>(&self, py: Python<'p>) -> PyResult<Bound<'p, PyAny>> {
+        // Fast path: the producer is ahead, so hand back a ready row without
+        // scheduling a future on the event loop
+        if let Ok(mut receiver) = self.receiver.try_lock() {
+            match receiver.try_recv() {
+                Ok(item) => {
+                    let row = Py::new(py, Self::wrap_row(item, &self.column_info)?)?;
+                    let ready = ReadyAwaitable {
+                        value: Some(row.into_any()),
+                    };
+                    return Ok(Py::new(py, ready)?.into_bound(py).into_any());
+                }
+                Err(mpsc::error::TryRecvError::Disconnected) => {
+                    return Err(pyo3::exceptions::PyStopAsyncIteration::new_err(""));
+                }
+                Err(mpsc::error::TryRecvError::Empty) => {}
+            }
+        }
+
+        let receiver = Arc::clone(&self.receiver);
+        let column_info = Arc::clone(&self.column_info);
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            match receiver.lock().await.recv().await {
+                Some(item) => Self::wrap_row(item, &column_info),
+                None => Err(pyo3::exceptions::PyStopAsyncIteration::new_err("")),
+            }
+        })
+    }
+
+    /// Get list of all column names, or an empty list before the first row arrives
+    pub fn columns<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        match self.column_info.get() {
+            Some(info) => info.py_names_list(py),
+            None => Ok(PyList::empty(py)),
+        }
+    }
+}
+
 /// A streaming wrapper around a Tiberius QueryStream
 /// Implements async iteration to fetch rows one at a time
 /// Lazy conversion: stores raw rows, converts to Python on-demand, caches for reset()
@@ -298,6 +449,27 @@ impl PyQueryStream {
         }
     }
 
+    /// Return self for asynchronous iteration protocol (async for row in result:)
+    pub fn __aiter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    /// Get the next row in asynchronous iteration
+    /// Rows are already buffered, so the returned awaitable resolves immediately
+    /// without scheduling anything on the event loop
+    pub fn __anext__(&mut self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        if self.position < self.tiberius_rows.len() {
+            let fast_row = self.get_or_convert_row(py, self.position)?;
+            self.position += 1;
+            let row = Py::new(py, fast_row)?.into_any();
+            Py::new(py, ReadyAwaitable { value: Some(row) }).map(|p| p.into_any())
+        } else {
+            // All rows have been iterated
+            self.is_complete = true;
+            Err(pyo3::exceptions::PyStopAsyncIteration::new_err(""))
+        }
+    }
+
     /// Get a row by index or a slice of rows
     /// Supports negative indexing and slicing: result[0], result[-1], result[5:10]
     pub fn __getitem__(&mut self, py: Python<'_>, key: Bound<PyAny>) -> PyResult<Py<PyAny>> {
@@ -397,10 +569,131 @@ impl PyQueryStream {
         Ok(py_list.into())
     }
 
+    /// Get every value of one column (by name or index) as a list
+    /// Converts only that column's cells, without building a FastRow per row,
+    /// and leaves the iteration position untouched
+    pub fn column(&self, py: Python<'_>, key: Bound<PyAny>) -> PyResult<Py<pyo3::types::PyList>> {
+        let Some(info) = self.column_info.as_ref() else {
+            return Ok(pyo3::types::PyList::empty(py).unbind());
+        };
+
+        let index = if let Ok(name) = key.extract::<&str>() {
+            *info
+                .map
+                .get(name)
+                .ok_or_else(|| PyValueError::new_err(format!("Column '{}' not found", name)))?
+        } else if let Ok(index) = key.extract::<isize>() {
+            // Normalise negative indices the same way FastRow does
+            let len = info.names.len() as isize;
+            let actual = if index < 0 { len + index } else { index };
+            if actual < 0 || actual >= len {
+                return Err(pyo3::exceptions::PyIndexError::new_err(
+                    "Column index out of range",
+                ));
+            }
+            actual as usize
+        } else {
+            return Err(PyValueError::new_err("Key must be string or integer"));
+        };
+
+        let col_type = info.column_types[index];
+        let mut values = Vec::with_capacity(self.tiberius_rows.len());
+        for (raw, cached) in self.tiberius_rows.iter().zip(self.converted_cache.iter()) {
+            // Reuse an already-converted row, otherwise read the cell straight from
+            // the raw row without consuming it
+            let value = match (cached, raw) {
+                (Some(row), _) => row.value_at(py, index)?,
+                (None, Some(row)) => type_mapping::sql_to_python(row, index, col_type, py)?,
+                (None, None) => return Err(PyValueError::new_err("Row already consumed")),
+            };
+            values.push(value);
+        }
+
+        Ok(pyo3::types::PyList::new(py, values)?.unbind())
+    }
+
+    /// Get every row as a plain dict in one call
+    /// Builds no FastRow objects, keys every dict with the result set's shared
+    /// interned column names, and leaves the iteration position untouched
+    pub fn to_dicts<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        let Some(info) = self.column_info.as_ref() else {
+            return Ok(PyList::empty(py));
+        };
+        let names = info.py_names(py);
+
+        let mut dicts = Vec::with_capacity(self.tiberius_rows.len());
+        for (raw, cached) in self.tiberius_rows.iter().zip(self.converted_cache.iter()) {
+            let dict = PyDict::new(py);
+            for (index, name) in names.iter().enumerate() {
+                let value = match (cached, raw) {
+                    (Some(row), _) => row.value_at(py, index)?,
+                    (None, Some(row)) => {
+                        type_mapping::sql_to_python(row, index, info.column_types[index], py)?
+                    }
+                    (None, None) => return Err(PyValueError::new_err("Row already consumed")),
+                };
+                dict.set_item(name.bind(py), value)?;
+            }
+            dicts.push(dict);
+        }
+
+        PyList::new(py, dicts)
+    }
+
+    /// Get the whole result set column-wise: {column name: [values...]}
+    /// One pass over the rows fills one list per column, so no per-row
+    /// object is built; the dict can be handed straight to pandas or polars
+    pub fn to_columns<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = PyDict::new(py);
+        let Some(info) = self.column_info.as_ref() else {
+            return Ok(dict);
+        };
+
+        let mut columns: Vec<Vec<Py<PyAny>>> = (0..info.names.len())
+            .map(|_| Vec::with_capacity(self.tiberius_rows.len()))
+            .collect();
+        for (raw, cached) in self.tiberius_rows.iter().zip(self.converted_cache.iter()) {
+            for (index, values) in columns.iter_mut().enumerate() {
+                let value = match (cached, raw) {
+                    (Some(row), _) => row.value_at(py, index)?,
+                    (None, Some(row)) => {
+                        type_mapping::sql_to_python(row, index, info.column_types[index], py)?
+                    }
+                    (None, None) => return Err(PyValueError::new_err("Row already consumed")),
+                };
+                values.push(value);
+            }
+        }
+
+        for (name, values) in info.py_names(py).iter().zip(columns) {
+            dict.set_item(name.bind(py), PyList::new(py, values)?)?;
+        }
+        Ok(dict)
+    }
+
+    /// Get the first column of the first row, or None for an empty result
+    /// Converts only that one cell, without building a FastRow or a row list,
+    /// and leaves the iteration position untouched
+    pub fn scalar(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
+        let (Some(info), Some(raw), Some(cached)) = (
+            self.column_info.as_ref(),
+            self.tiberius_rows.first(),
+            self.converted_cache.first(),
+        ) else {
+            return Ok(py.None());
+        };
+
+        match (cached, raw) {
+            (Some(row), _) => row.value_at(py, 0),
+            (None, Some(row)) => type_mapping::sql_to_python(row, 0, info.column_types[0], py),
+            (None, None) => Err(PyValueError::new_err("Row already consumed")),
+        }
+    }
+
     /// Get column names
-    pub fn columns(&self) -> PyResult<Vec<String>> {
+    pub fn columns<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
         match &self.column_info {
-            Some(info) => Ok(info.names.clone()),
+            Some(info) => info.py_names_list(py),
             None => Err(PyValueError::new_err("No column information available")),
         }
     }
@@ -466,7 +759,7 @@ impl PyQueryStream {
 
 impl PyQueryStream {
     /// Private helper: check cache → convert from tiberius row → cache result
-    fn get_or_convert_row(&mut self, py: Python<'_>, index: usize) -> PyResult<PyFastRow> {
+    fn get_or_convert_row(&mut self, _py: Python<'_>, index: usize) -> PyResult<PyFastRow> {
         if let Some(cached) = &self.converted_cache[index] {
             Ok(cached.clone())
         } else {
@@ -477,7 +770,7 @@ impl PyQueryStream {
                 .column_info
                 .as_ref()
                 .ok_or_else(|| PyValueError::new_err("No column info"))?;
-            let fast_row = PyFastRow::from_tiberius_row(row, py, Arc::clone(column_info))?;
+            let fast_row = PyFastRow::from_tiberius_row(row, Arc::clone(column_info));
             self.converted_cache[index] = Some(fast_row.clone());
             Ok(fast_row)
         }
@@ -5,6 +5,7 @@ Run with: python -m pytest tests/
 """
 
 import asyncio
+import time
 from decimal import Decimal
 
 import pytest
@@ -12,7 +13,7 @@ from conftest import Config
 
 try:
     import fastmssql
-    from fastmssql import Connection
+    from fastmssql import Connection, PoolConfig, SqlConnectionError
 except ImportError:
     pytest.fail("mssql wrapper not available - make sure mssql.py is importable")
 
@@ -56,6 +57,50 @@ async def test_simple_query(test_config: Config):
         pytest.fail(f"Database not available: {e}")
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_query_once_without_pool(test_config: Config):
+    """Test a one-shot query that never creates the pool."""
+    try:
+        conn = Connection(test_config.connection_string)
+        result = await conn.query_once("SELECT @P1 as test_value", [1])
+        assert result.rows()[0]["test_value"] == 1
+        assert not await conn.is_connected()
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.asyncio
+async def test_query_once_connect_timeout():
+    """Test that query_once gives up on an unreachable host after connection_timeout."""
+    # 10.255.255.1 is non-routable, so the TCP connect never completes
+    conn = Connection(
+        server="10.255.255.1",
+        username="sa",
+        password="unused",
+        pool_config=PoolConfig(connection_timeout_secs=1),
+    )
+    start = time.perf_counter()
+    with pytest.raises(SqlConnectionError):
+        await conn.query_once("SELECT 1")
+    assert time.perf_counter() - start < 10
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_execute_scalar(test_config: Config):
+    """Test execute_scalar returns the first value of the first row."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            assert await conn.execute_scalar("SELECT 42 as answer, 'x' as other") == 42
+            assert (
+                await conn.execute_scalar("SELECT @P1 + 1 as n", [9]) == 10
+            )
+            assert await conn.execute_scalar("SELECT 1 WHERE 1 = 0") is None
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_multiple_queries(test_config: Config):
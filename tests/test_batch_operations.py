@@ -131,6 +131,26 @@ class TestBatchQueries:
         except Exception as e:
             pytest.fail(f"Database not available: {e}")
 
+    @pytest.mark.asyncio
+    async def test_query_results_returns_every_result_set(self, test_config: Config):
+        """Test that one multi-statement batch yields one stream per SELECT."""
+        try:
+            async with Connection(test_config.connection_string) as conn:
+                results = await conn.query_results(
+                    "SELECT DB_NAME() as database_name; "
+                    "SELECT @P1 as param_value; "
+                    "SELECT 1 + 1 as sum_value",
+                    [42],
+                )
+
+                assert len(results) == 3
+                assert results[0].rows()[0]["database_name"] is not None
+                assert results[1].rows()[0]["param_value"] == 42
+                assert results[2].rows()[0]["sum_value"] == 2
+
+        except Exception as e:
+            pytest.fail(f"Database not available: {e}")
+
 
 class TestBatchCommands:
     """Test batch command execution functionality."""
@@ -374,6 +394,32 @@ class TestBulkInsert:
         except Exception as e:
             pytest.fail(f"Database not available: {e}")
 
+    @pytest.mark.asyncio
+    async def test_bulk_insert_single_column_over_row_limit(self, test_config: Config):
+        """Test bulk insert into a one-column table past the 1000-row VALUES limit."""
+        try:
+            async with Connection(test_config.connection_string) as conn:
+                await conn.execute("DROP TABLE IF EXISTS bulk_narrow_test")
+                await conn.execute("CREATE TABLE bulk_narrow_test (value INT)")
+
+                try:
+                    data_rows = [[i] for i in range(2500)]
+                    rows_inserted = await conn.bulk_insert(
+                        "bulk_narrow_test", ["value"], data_rows
+                    )
+                    assert rows_inserted == 2500
+
+                    verify_result = await conn.query(
+                        "SELECT COUNT(*) as count FROM bulk_narrow_test"
+                    )
+                    assert verify_result.rows()[0]["count"] == 2500
+
+                finally:
+                    await conn.execute("DROP TABLE IF EXISTS bulk_narrow_test")
+
+        except Exception as e:
+            pytest.fail(f"Database not available: {e}")
+
     @pytest.mark.asyncio
     async def test_bulk_insert_error_handling(self, test_config: Config):
         """Test error handling in bulk insert operations."""
@@ -87,6 +87,53 @@ class TestConnectionPoolReuse:
                 rows = result.rows()
                 assert rows[0]["test_val"] == i
 
+    @pytest.mark.asyncio
+    async def test_warm_opens_connections_up_front(self, test_config: Config):
+        """Test that warm() pre-opens connections, capped at max_size."""
+        pool_config = PoolConfig(max_size=4, min_idle=1)
+        async with Connection(test_config.connection_string, pool_config) as conn:
+            assert await conn.warm(3) >= 3
+            assert await conn.warm(10) == 4
+
+            stats = await conn.pool_stats()
+            assert stats["connections"] == 4
+            assert stats["active_connections"] == 0
+
+    @pytest.mark.asyncio
+    async def test_warm_with_connection_checked_out(self, test_config: Config):
+        """Test that warm() only opens the shortfall and never waits on busy connections."""
+        pool_config = PoolConfig(max_size=3, min_idle=1)
+        async with Connection(test_config.connection_string, pool_config) as conn:
+            busy = asyncio.create_task(conn.execute("WAITFOR DELAY '00:00:05'"))
+            while (await conn.pool_stats())["active_connections"] < 1:
+                await asyncio.sleep(0.05)
+
+            # The checked-out connection counts toward the target, so warm()
+            # must finish well before the WAITFOR releases it
+            assert await asyncio.wait_for(conn.warm(), timeout=4) == 3
+
+            stats = await conn.pool_stats()
+            assert stats["connections"] == 3
+            assert stats["active_connections"] == 1
+
+            await busy
+            stats = await conn.pool_stats()
+            assert stats["connections"] == 3
+            assert stats["active_connections"] == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_eviction_times_out_without_evictions(
+        self, test_config: Config
+    ):
+        """Test that wait_for_eviction() returns 0 when nothing is evicted."""
+        pool_config = PoolConfig(max_size=2, min_idle=2)
+        async with Connection(test_config.connection_string, pool_config) as conn:
+            assert await conn.wait_for_eviction(0.2) == 0
+
+            stats = await conn.pool_stats()
+            assert stats["closed_idle_timeout"] == 0
+            assert stats["closed_max_lifetime"] == 0
+
     @pytest.mark.asyncio
     async def test_multiple_concurrent_queries(self, test_config: Config):
         """Test multiple concurrent queries within a single connection context."""
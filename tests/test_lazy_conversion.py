@@ -475,3 +475,182 @@ async def test_negative_indexing_edge_cases(test_config: Config):
                 _ = result[-2]
     except Exception as e:
         pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_column_access_by_name_and_index(test_config: Config):
+    """Test that column() reads one column across rows without moving position."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            result = await conn.query(
+                "SELECT 1 as id, 'a' as name UNION ALL SELECT 2, 'b' UNION ALL SELECT 3, 'c'"
+            )
+
+            # Convert one row first so column() mixes cached and raw rows
+            assert result[1]["name"] == "b"
+
+            assert result.column("id") == [1, 2, 3]
+            assert result.column(1) == ["a", "b", "c"]
+            assert result.position() == 0
+
+            # Rows are still available for normal iteration afterwards
+            assert [row["id"] for row in result] == [1, 2, 3]
+
+            with pytest.raises(ValueError, match="Column 'missing' not found"):
+                result.column("missing")
+            with pytest.raises(IndexError, match="Column index out of range"):
+                result.column(2)
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_column_negative_index(test_config: Config):
+    """Test that column() counts negative indexes from the end, like FastRow."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            result = await conn.query(
+                "SELECT 1 as id, 'a' as name UNION ALL SELECT 2, 'b'"
+            )
+
+            assert result.column(-1) == ["a", "b"]
+            assert result.column(-2) == [1, 2]
+            assert result.column(-1) == [row[-1] for row in result]
+
+            with pytest.raises(IndexError, match="Column index out of range"):
+                result.column(-3)
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_to_dicts_returns_every_row(test_config: Config):
+    """Test that to_dicts() returns plain dicts without moving position."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            result = await conn.query(
+                "SELECT 1 as id, 'a' as name UNION ALL SELECT 2, 'b'"
+            )
+
+            # Convert one row first so to_dicts() mixes cached and raw rows
+            assert result[0]["id"] == 1
+
+            assert result.to_dicts() == [
+                {"id": 1, "name": "a"},
+                {"id": 2, "name": "b"},
+            ]
+            assert result.position() == 0
+
+            empty = await conn.query("SELECT 1 as id WHERE 1 = 0")
+            assert empty.to_dicts() == []
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_async_iteration_yields_rows(test_config: Config):
+    """Test that async for walks the rows and shares position with sync iteration."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            result = await conn.query(
+                "SELECT 1 as id UNION ALL SELECT 2 UNION ALL SELECT 3"
+            )
+
+            assert [row["id"] async for row in result] == [1, 2, 3]
+            assert result.position() == 3
+            assert [row["id"] async for row in result] == []
+
+            result.reset()
+            assert next(result)["id"] == 1
+            assert [row["id"] async for row in result] == [2, 3]
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_row_repr_shows_values(test_config: Config):
+    """Test that a row prints its column values without building a dict."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            result = await conn.query("SELECT 1 as id, 'a' as name, NULL as note")
+            row = result[0]
+
+            assert repr(row) == "FastRow(id=1, name='a', note=None)"
+            assert str(row) == repr(row)
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_query_iter_streams_rows(test_config: Config):
+    """Test that query_iter yields every row, stops early and surfaces errors."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            stream = conn.query_iter(
+                "SELECT TOP (@P1) ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) as n "
+                "FROM sys.all_objects a CROSS JOIN sys.all_objects b",
+                [1000],
+            )
+            assert [row["n"] async for row in stream] == list(range(1, 1001))
+            assert stream.columns() == ["n"]
+
+            # Leaving the loop early must not break the pooled connection
+            async for row in conn.query_iter("SELECT 1 as id UNION ALL SELECT 2"):
+                assert row["id"] == 1
+                break
+            result = await conn.query("SELECT 42 as answer")
+            assert result[0]["answer"] == 42
+
+            with pytest.raises(Exception):
+                async for _ in conn.query_iter("SELECT * FROM non_existent_table_12345"):
+                    pass
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_to_columns_returns_column_lists(test_config: Config):
+    """Test that to_columns() returns one list per column without moving position."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            result = await conn.query(
+                "SELECT 1 as id, 'a' as name UNION ALL SELECT 2, 'b'"
+            )
+
+            # Convert one row first so to_columns() mixes cached and raw rows
+            assert result[1]["name"] == "b"
+
+            assert result.to_columns() == {"id": [1, 2], "name": ["a", "b"]}
+            assert result.position() == 0
+
+            empty = await conn.query("SELECT 1 as id WHERE 1 = 0")
+            assert empty.to_columns() == {}
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_scalar_returns_first_value(test_config: Config):
+    """Test that scalar() returns the first column of the first row, or None."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            result = await conn.query("SELECT 42 as answer, 'x' as other")
+            assert result.scalar() == 42
+            assert result.position() == 0
+
+            # Same value once the row has been converted
+            assert result[0]["answer"] == 42
+            assert result.scalar() == 42
+
+            empty = await conn.query("SELECT 1 as id WHERE 1 = 0")
+            assert empty.scalar() is None
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
@@ -340,6 +340,37 @@ class TestParameters:
         assert param.value == "hello"
         assert not param.is_expanded
 
+    def test_parameters_freeze_expands_iterables(self):
+        """Test that freeze() snapshots the expanded values."""
+        params = Parameters("John", [1, 2, 3])
+        frozen = params.freeze()
+
+        assert len(frozen) == 4
+        assert repr(frozen) == "FrozenParameters(positional=4)"
+
+        # The snapshot does not follow later changes
+        params.add(99)
+        assert len(frozen) == 4
+
+    def test_parameters_setitem_keeps_type(self):
+        """Test that item assignment replaces a value in place and keeps its type."""
+        params = Parameters().add(0, "INT").add("", "NVARCHAR")
+        params[0] = 42
+        params[-1] = [1, 2]
+
+        assert params.to_list() == [42, [1, 2]]
+        assert params.positional[0].sql_type == "INT"
+        assert params.positional[1].sql_type == "NVARCHAR"
+        assert params.positional[1].is_expanded
+
+        with pytest.raises(IndexError):
+            params[2] = 1
+
+    def test_parameters_freeze_rejects_named(self):
+        """Test that freeze() reports named parameters like to_list() does."""
+        with pytest.raises(ValueError):
+            Parameters(name="John").freeze()
+
 
 @pytest.mark.integration
 class TestParametersIntegration:
@@ -542,6 +573,24 @@ class TestParametersIntegration:
         except Exception as e:
             pytest.fail(f"Database not available: {e}")
 
+    @pytest.mark.asyncio
+    async def test_frozen_parameter_reuse(self, test_config: Config):
+        """Test reusing frozen Parameters across multiple queries."""
+        try:
+            async with Connection(test_config.connection_string) as conn:
+                frozen = Parameters(42, [1, 2, 3]).freeze()
+
+                for _ in range(3):
+                    result = await conn.query(
+                        "SELECT @P1 as num, @P2 + @P3 + @P4 as total", frozen
+                    )
+                    row = result.rows()[0]
+                    assert row["num"] == 42
+                    assert row["total"] == 6
+
+        except Exception as e:
+            pytest.fail(f"Database not available: {e}")
+
     @pytest.mark.asyncio
     async def test_automatic_in_clause_expansion(self, test_config: Config):
         """Test automatic IN clause expansion with real database."""
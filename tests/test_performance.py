@@ -12,7 +12,7 @@ import pytest
 from conftest import Config
 
 try:
-    from fastmssql import Connection
+    from fastmssql import Connection, PoolConfig
 except ImportError:
     pytest.fail("mssql wrapper not available - make sure mssql.py is importable")
 
@@ -57,9 +57,9 @@ async def test_large_result_set(test_config: Config):
                     await conn.execute(insert_sql)
 
                 # Test retrieving large result set
-                start_time = time.time()
+                start_time = time.perf_counter()
                 result = await conn.query("SELECT * FROM test_large_data ORDER BY id")
-                end_time = time.time()
+                end_time = time.perf_counter()
 
                 rows = result.rows() if result.has_rows() else []
                 assert len(rows) == total_records
@@ -73,11 +73,11 @@ async def test_large_result_set(test_config: Config):
                 assert query_time < 10.0  # Should complete within 10 seconds
 
                 # Test filtering on large dataset
-                start_time = time.time()
+                start_time = time.perf_counter()
                 filtered_result = await conn.query(
                     "SELECT * FROM test_large_data WHERE data_number > 4000"
                 )
-                end_time = time.time()
+                end_time = time.perf_counter()
 
                 filtered_rows = filtered_result.rows()
                 assert len(filtered_rows) < total_records
@@ -114,13 +114,13 @@ async def test_concurrent_connections(test_config: Config):
 
         # Test with multiple concurrent async connections
         num_connections = 10
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Use asyncio.gather to run multiple async operations concurrently
         tasks = [run_query(i) for i in range(num_connections)]
         results = await asyncio.gather(*tasks)
 
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         assert len(results) == num_connections
         assert all(r["success"] for r in results)
@@ -173,13 +173,13 @@ async def test_bulk_insert_performance(test_config: Config):
                     values.append(f"('Name {i}', {i}, 'Description for record {i}')")
 
                 # Measure insert time
-                start_time = time.time()
+                start_time = time.perf_counter()
                 insert_sql = f"""
                     INSERT INTO test_bulk_insert (name, value, description) VALUES 
                     {", ".join(values)}
                 """
                 result = await conn.execute(insert_sql)
-                end_time = time.time()
+                end_time = time.perf_counter()
 
                 # Handle both cases: result object with affected_rows() method or direct int
                 if hasattr(result, "affected_rows"):
@@ -242,13 +242,13 @@ async def test_repeated_query_performance(test_config: Config):
                 query = "SELECT category, SUM(value) as total FROM test_repeated_queries GROUP BY category"
                 num_iterations = 100
 
-                start_time = time.time()
+                start_time = time.perf_counter()
                 for i in range(num_iterations):
                     result = await conn.query(query)
                     assert (
                         result.has_rows() and len(result.rows()) == 3
                     )  # Should always return 3 categories
-                end_time = time.time()
+                end_time = time.perf_counter()
 
                 total_time = end_time - start_time
                 avg_time_per_query = total_time / num_iterations
@@ -295,12 +295,12 @@ async def test_async_concurrent_queries(test_config: Config):
 
         # Run multiple async queries concurrently
         num_queries = 20
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         tasks = [run_async_query(i) for i in range(num_queries)]
         results = await asyncio.gather(*tasks)
 
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         assert len(results) == num_queries
         assert all(r["success"] for r in results)
@@ -317,6 +317,54 @@ async def test_async_concurrent_queries(test_config: Config):
         pytest.fail(f"Database not available: {e}")
 
 
+@pytest.mark.performance
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_async_concurrent_queries_shared_pool(test_config: Config):
+    """Test concurrent async query execution over one shared pool."""
+    try:
+        async with Connection(
+            test_config.connection_string, PoolConfig.high_throughput()
+        ) as conn:
+
+            async def run_async_query(query_id):
+                """Function to run async queries concurrently."""
+                result = await conn.query(f"""
+                    SELECT 
+                        {query_id} as query_id,
+                        GETDATE() as execution_time,
+                        'Async query result' as message
+                """)
+                return {
+                    "query_id": query_id,
+                    "result": result.rows()[0] if result.has_rows() else {},
+                    "success": True,
+                }
+
+            # Each task borrows a pooled connection instead of paying a fresh
+            # login per task
+            num_queries = 20
+            start_time = time.perf_counter()
+
+            tasks = [run_async_query(i) for i in range(num_queries)]
+            results = await asyncio.gather(*tasks)
+
+            end_time = time.perf_counter()
+
+        assert len(results) == num_queries
+        assert all(r["success"] for r in results)
+
+        query_ids = [r["query_id"] for r in results]
+        assert set(query_ids) == set(range(num_queries))
+
+        total_time = end_time - start_time
+        print(f"Shared-pool concurrent queries time: {total_time:.3f} seconds")
+        assert total_time < 15.0  # Should complete within 15 seconds
+
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
 @pytest.mark.performance
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -384,14 +432,14 @@ async def test_connection_pool_simulation(test_config: Config):
     try:
         # Test rapid connection creation/destruction
         num_connections = 50
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         for i in range(num_connections):
             async with Connection(test_config.connection_string) as conn:
                 result = await conn.query("SELECT 1 as test_value")
                 assert result.rows()[0]["test_value"] == 1
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         total_time = end_time - start_time
         connections_per_second = (
             num_connections / total_time if total_time > 0 else float("inf")
@@ -416,7 +464,7 @@ async def test_long_running_query(test_config: Config):
     try:
         async with Connection(test_config.connection_string) as conn:
             # Run a query that takes some time to execute
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = await conn.query("""
                 WITH NumberSequence AS (
                     SELECT 1 as n
@@ -429,7 +477,7 @@ async def test_long_running_query(test_config: Config):
                 FROM NumberSequence
                 OPTION (MAXRECURSION 10000)
             """)
-            end_time = time.time()
+            end_time = time.perf_counter()
 
             assert result.has_rows() and len(result.rows()) == 1
             assert result.rows()[0]["total_count"] == 10000
@@ -468,7 +516,7 @@ async def test_stress_mixed_operations(test_config: Config):
             try:
                 # Perform mixed operations
                 num_operations = 1000
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 for i in range(num_operations):
                     if i % 3 == 0:
@@ -493,7 +541,7 @@ async def test_stress_mixed_operations(test_config: Config):
                         """)
                         assert result.has_rows() and len(result.rows()) == 1
 
-                end_time = time.time()
+                end_time = time.perf_counter()
                 total_time = end_time - start_time
                 ops_per_second = (
                     num_operations / total_time if total_time > 0 else float("inf")
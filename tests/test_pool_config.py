@@ -229,8 +229,8 @@ class TestPoolConfigPresets:
         config = PoolConfig.low_resource()
         assert config.max_size == 3
         assert config.min_idle == 1
-        assert config.max_lifetime_secs == 900
-        assert config.idle_timeout_secs == 300
+        assert config.max_lifetime_secs == 1800
+        assert config.idle_timeout_secs == 60
         assert config.connection_timeout_secs == 15
 
     def test_development(self):
@@ -238,10 +238,22 @@ class TestPoolConfigPresets:
         config = PoolConfig.development()
         assert config.max_size == 5
         assert config.min_idle == 1
-        assert config.max_lifetime_secs == 600
-        assert config.idle_timeout_secs == 180
+        assert config.max_lifetime_secs == 1800
+        assert config.idle_timeout_secs == 60
         assert config.connection_timeout_secs == 10
 
+    def test_presets_keep_a_warm_connection(self):
+        """Every multi-connection preset keeps at least one idle connection."""
+        for config in (
+            PoolConfig.low_resource(),
+            PoolConfig.development(),
+            PoolConfig.high_throughput(),
+            PoolConfig.performance(),
+            PoolConfig.adaptive(1),
+        ):
+            assert config.max_size >= 2
+            assert config.min_idle is not None and config.min_idle >= 1
+
     def test_performance(self):
         """Test performance preset."""
         config = PoolConfig.performance()
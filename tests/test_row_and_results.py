@@ -69,6 +69,43 @@ async def test_row_get_method(test_config: Config):
         pytest.fail(f"Database not available: {e}")
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_row_attribute_access(test_config: Config):
+    """Test accessing row columns as attributes."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            result = await conn.query("SELECT 1 as id, 'test' as name, 7 as [values]")
+            row = result[0]
+
+            assert row.id == 1
+            assert row.name == "test"
+
+            # Methods take precedence over a column with the same name
+            assert callable(row.values)
+            assert row["values"] == 7
+
+            with pytest.raises(AttributeError):
+                _ = row.non_existent_column
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_row_dict_conversion(test_config: Config):
+    """Test that dict(row) builds the same mapping as to_dict()."""
+    try:
+        async with Connection(test_config.connection_string) as conn:
+            result = await conn.query("SELECT 1 as id, 'test' as name")
+            row = result[0]
+
+            assert row.keys() == ["id", "name"]
+            assert dict(row) == row.to_dict() == {"id": 1, "name": "test"}
+    except Exception as e:
+        pytest.fail(f"Database not available: {e}")
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_row_none_values(test_config: Config):
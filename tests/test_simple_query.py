@@ -1,12 +1,13 @@
 """
-Tests for Connection.simple_query and Transaction.simple_query.
+Tests for Connection.simple_query and Transaction.simple_query, and for how
+parameterless query() and query_once() differ from them.
 """
 
 import pytest
 from conftest import Config
 
 try:
-    from fastmssql import Connection, QueryStream, SqlError, Transaction
+    from fastmssql import Connection, PoolConfig, QueryStream, SqlError, Transaction
 except ImportError:
     pytest.fail("fastmssql not available - run 'maturin develop' first")
 
@@ -615,3 +616,91 @@ async def test_simple_query_row_len(test_config: Config):
         result = await conn.simple_query("SELECT 1 AS a, 2 AS b, 3 AS c")
         row = result.rows()[0]
         assert len(row) == 3
+
+
+# ---------------------------------------------------------------------------
+# query() / query_once() without parameters
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_parameterless_query_multi_statement(test_config: Config):
+    """A parameterless multi-statement query() should return the first result set."""
+    async with Connection(test_config.connection_string) as conn:
+        result = await conn.query("DECLARE @x INT = 5; SELECT @x AS n; SELECT 2 AS m")
+        assert result.rows()[0]["n"] == 5
+
+        result = await conn.query_once("DECLARE @x INT = 6; SELECT @x AS n")
+        assert result.rows()[0]["n"] == 6
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_parameterless_query_invalid_sql_raises(test_config: Config):
+    """Errors in a parameterless query() or query_once() should raise SqlError."""
+    async with Connection(test_config.connection_string) as conn:
+        with pytest.raises(SqlError):
+            await conn.query("SELECT * FROM dbo.this_table_definitely_does_not_exist_xyz")
+        with pytest.raises(SqlError):
+            await conn.query_once("THIS IS NOT VALID SQL !!!!")
+
+        # The pooled connection is still usable afterwards
+        result = await conn.query("SELECT 1 AS n")
+        assert result.rows()[0]["n"] == 1
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_parameterless_query_temp_table_scope(test_config: Config):
+    """#temp tables outlive simple_query() but not a parameterless query()."""
+    # A single pooled connection, so every call below runs on the same session
+    pool_config = PoolConfig(max_size=1, min_idle=1)
+    async with Connection(test_config.connection_string, pool_config) as conn:
+        try:
+            await conn.simple_query("CREATE TABLE #sq_batch_scope (id INT); SELECT 1 AS n")
+            result = await conn.query(
+                "SELECT OBJECT_ID('tempdb..#sq_batch_scope') AS oid"
+            )
+            assert result.rows()[0]["oid"] is not None
+
+            await conn.query("CREATE TABLE #sq_rpc_scope (id INT); SELECT 1 AS n")
+            result = await conn.query("SELECT OBJECT_ID('tempdb..#sq_rpc_scope') AS oid")
+            assert result.rows()[0]["oid"] is None
+        finally:
+            await conn.execute_script("DROP TABLE IF EXISTS #sq_batch_scope")
+
+
+# ---------------------------------------------------------------------------
+# execute_script
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_execute_script_runs_every_statement(test_config: Config):
+    """execute_script should run a multi-statement script as one batch."""
+    async with Connection(test_config.connection_string) as conn:
+        try:
+            result = await conn.execute_script(f"""
+                DROP TABLE IF EXISTS {_TABLE_NAME};
+                CREATE TABLE {_TABLE_NAME} (id INT);
+                INSERT INTO {_TABLE_NAME} VALUES (1), (2);
+            """)
+            assert result is None
+
+            rows = await conn.query(f"SELECT COUNT(*) AS cnt FROM {_TABLE_NAME}")
+            assert rows[0]["cnt"] == 2
+        finally:
+            await _drop_table(conn)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_execute_script_raises_on_later_statement(test_config: Config):
+    """An error in any statement of the script should be raised, not just the first."""
+    async with Connection(test_config.connection_string) as conn:
+        with pytest.raises(SqlError):
+            await conn.execute_script(
+                "SELECT 1 AS n; SELECT * FROM non_existent_table_12345"
+            )